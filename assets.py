@@ -0,0 +1,272 @@
+"""
+Pipeline des images d'arrière-plan (publication statique mémoïsée)
+
+Chaque image est publiée une seule fois par processus dans le dossier
+`static/` servi par Streamlit (`server.enableStaticServing`), sous un nom
+contenant son empreinte : le navigateur peut la mettre en cache et le CSS
+injecté ne contient plus qu'une URL courte au lieu d'un data URI de
+plusieurs Mo. Sans service statique, repli sur un data URI mémoïsé.
+
+Si Pillow est disponible, des variantes WebP/JPEG recompressées sont
+générées à plusieurs largeurs et sélectionnées par le navigateur via
+`image-set()` et des media queries. Pour les pré-générer au déploiement :
+
+    python assets.py
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional
+import base64
+import hashlib
+import mimetypes
+import os
+import shutil
+
+from config import BACKGROUND_VARIANT_WIDTHS, BACKGROUND_VARIANT_QUALITY
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(APP_DIR, 'static')
+BACKGROUND_SUBDIR = 'backgrounds'
+STATIC_URL_PREFIX = 'app/static'
+
+
+def resolve_asset_path(image_path: str) -> str:
+    """Chemin absolu d'un actif (les chemins relatifs partent du dossier de l'app)"""
+    if os.path.isabs(image_path):
+        return image_path
+    return os.path.join(APP_DIR, image_path)
+
+
+def _static_serving_enabled() -> bool:
+    """Vérifier si Streamlit sert le dossier `static/`"""
+    try:
+        import streamlit as st
+        return bool(st.get_option('server.enableStaticServing'))
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=64)
+def _file_digest(path: str) -> str:
+    """Empreinte courte du contenu d'un fichier"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:12]
+
+
+@lru_cache(maxsize=32)
+def get_base64_image(image_path):
+    """Encoder une image en Base64 pour l'intégrer au CSS (une fois par processus)"""
+    if not image_path:
+        return None
+    path = resolve_asset_path(image_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        mime = mimetypes.guess_type(path)[0] or 'image/png'
+        with open(path, "rb") as image_file:
+            encoded_string = base64.b64encode(image_file.read()).decode()
+            return f"data:{mime};base64,{encoded_string}"
+    except Exception:
+        return None
+
+
+def publish_static_asset(image_path: str, subdir: str = BACKGROUND_SUBDIR) -> Optional[str]:
+    """
+    Copier un actif dans `static/` sous un nom adressé par son contenu
+
+    Args:
+        image_path: Chemin de l'image source
+        subdir: Sous-dossier de `static/`
+
+    Returns:
+        URL relative servie par Streamlit, ou None si impossible
+    """
+    source = resolve_asset_path(image_path)
+    if not os.path.exists(source):
+        return None
+
+    stem, ext = os.path.splitext(os.path.basename(source))
+    filename = f"{stem}-{_file_digest(source)}{ext}"
+    target_dir = os.path.join(STATIC_DIR, subdir)
+    target = os.path.join(target_dir, filename)
+
+    if not os.path.exists(target):
+        try:
+            os.makedirs(target_dir, exist_ok=True)
+            tmp_target = f"{target}.{os.getpid()}.tmp"
+            try:
+                os.link(source, tmp_target)
+            except OSError:
+                shutil.copyfile(source, tmp_target)
+            # Remplacement atomique : plusieurs processus peuvent publier en même temps
+            os.replace(tmp_target, target)
+        except OSError:
+            return None
+
+    return f"{STATIC_URL_PREFIX}/{subdir}/{filename}"
+
+
+@lru_cache(maxsize=32)
+def get_background_url(image_path: Optional[str]) -> Optional[str]:
+    """
+    Obtenir l'URL CSS d'une image d'arrière-plan (calculée une fois par processus)
+
+    Args:
+        image_path: Chemin de l'image (voir WEATHER_IMAGES)
+
+    Returns:
+        URL statique cacheable, data URI en repli, ou None si l'image manque
+    """
+    if not image_path:
+        return None
+    if _static_serving_enabled():
+        url = publish_static_asset(image_path)
+        if url:
+            return url
+    return get_base64_image(image_path)
+
+
+# Formats des variantes : (format Pillow, extension, type MIME)
+VARIANT_FORMATS = [
+    ('WEBP', '.webp', 'image/webp'),
+    ('JPEG', '.jpg', 'image/jpeg')
+]
+
+
+def _save_variant(image, width: int, fmt: str, target: str) -> None:
+    """Redimensionner et enregistrer une variante (écriture atomique)"""
+    from PIL import Image
+
+    height = round(image.height * width / image.width)
+    resized = image.resize((width, height), Image.LANCZOS) if width < image.width else image
+    tmp_target = f"{target}.{os.getpid()}.tmp"
+    quality = BACKGROUND_VARIANT_QUALITY['webp' if fmt == 'WEBP' else 'jpeg']
+    if fmt == 'WEBP':
+        resized.save(tmp_target, 'WEBP', quality=quality, method=6)
+    else:
+        resized.save(tmp_target, 'JPEG', quality=quality, optimize=True, progressive=True)
+    os.replace(tmp_target, target)
+
+
+@lru_cache(maxsize=32)
+def build_background_variants(image_path: Optional[str]) -> List[Dict[str, str]]:
+    """
+    Générer (une fois) les variantes responsives d'une image d'arrière-plan
+
+    Args:
+        image_path: Chemin de l'image source
+
+    Returns:
+        Liste de variantes {width, mime, url}, triée par largeur croissante ;
+        vide si Pillow, l'image ou le service statique sont indisponibles
+    """
+    if not image_path or not _static_serving_enabled():
+        return []
+    source = resolve_asset_path(image_path)
+    if not os.path.exists(source):
+        return []
+    try:
+        from PIL import Image
+    except ImportError:
+        return []
+
+    stem = os.path.splitext(os.path.basename(source))[0]
+    digest = _file_digest(source)
+    target_dir = os.path.join(STATIC_DIR, BACKGROUND_SUBDIR)
+    variants = []
+
+    try:
+        os.makedirs(target_dir, exist_ok=True)
+        with Image.open(source) as opened:
+            image = None
+            # Jamais d'agrandissement : la plus grande variante est plafonnée à la source
+            widths = sorted({min(width, opened.width) for width in BACKGROUND_VARIANT_WIDTHS})
+            for width in widths:
+                for fmt, ext, mime in VARIANT_FORMATS:
+                    filename = f"{stem}-{digest}-{width}w{ext}"
+                    target = os.path.join(target_dir, filename)
+                    if not os.path.exists(target):
+                        if image is None:
+                            image = opened.convert('RGB')
+                        _save_variant(image, width, fmt, target)
+                    variants.append({
+                        'width': width,
+                        'mime': mime,
+                        'url': f"{STATIC_URL_PREFIX}/{BACKGROUND_SUBDIR}/{filename}"
+                    })
+    except (OSError, ValueError):
+        return []
+
+    return variants
+
+
+def get_responsive_background_css(
+    image_path: Optional[str],
+    overlay: Optional[str] = None,
+    selector: str = '.stApp'
+) -> Optional[str]:
+    """
+    Construire les règles CSS qui choisissent la plus petite variante adaptée
+
+    Args:
+        image_path: Chemin de l'image source
+        overlay: Calque CSS superposé à l'image (ex: assombrissement nocturne)
+        selector: Sélecteur CSS de l'élément de fond
+
+    Returns:
+        Règles CSS (image-set + media queries), ou None sans variantes
+    """
+    variants = build_background_variants(image_path)
+    if not variants:
+        return None
+
+    by_width: Dict[int, List[Dict[str, str]]] = {}
+    for variant in variants:
+        by_width.setdefault(variant['width'], []).append(variant)
+    widths = sorted(by_width)
+    prefix = f"{overlay}, " if overlay else ""
+
+    def image_set(width: int) -> str:
+        candidates = ", ".join(
+            f'url("{variant["url"]}") type("{variant["mime"]}")'
+            for variant in by_width[width]
+        )
+        return f"{prefix}image-set({candidates})"
+
+    # Repli pour les navigateurs sans image-set() : JPEG le plus large
+    fallback = next(v['url'] for v in by_width[widths[-1]] if v['mime'] == 'image/jpeg')
+    rules = [
+        f"{selector} {{ background: {prefix}url('{fallback}') no-repeat center center fixed; "
+        f"background-image: {image_set(widths[-1])}; background-size: cover; }}"
+    ]
+    # Du plus large au plus étroit : la dernière media query applicable l'emporte
+    for width in reversed(widths[:-1]):
+        rules.append(
+            f"@media (max-width: {width}px) {{ {selector} {{ background-image: {image_set(width)}; }} }}"
+        )
+    return "\n        ".join(rules)
+
+
+if __name__ == "__main__":
+    # Étape de build : pré-générer toutes les variantes avant le déploiement
+    from ui_components import WEATHER_IMAGES
+
+    for category, path in WEATHER_IMAGES.items():
+        source = resolve_asset_path(path)
+        if not os.path.exists(source):
+            print(f"{category}: image manquante ({path})")
+            continue
+        variants = build_background_variants(path)
+        if not variants:
+            print(f"{category}: aucune variante (Pillow ou enableStaticServing manquant)")
+            continue
+        original = os.path.getsize(source)
+        sizes = ", ".join(
+            f"{v['width']}w {v['mime'].split('/')[1]} "
+            f"{os.path.getsize(os.path.join(APP_DIR, v['url'].replace(STATIC_URL_PREFIX, 'static', 1))) // 1024} Ko"
+            for v in variants
+        )
+        print(f"{category}: {original // 1024} Ko -> {sizes}")
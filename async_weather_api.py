@@ -0,0 +1,291 @@
+"""
+Client asynchrone (asyncio) pour les appels API météo
+
+Même surface que WeatherAPI, mais sans bloquer de thread : les attentes
+entre tentatives utilisent asyncio.sleep et les tâches restent annulables.
+"""
+
+import asyncio
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlparse
+
+try:
+    import aiohttp
+except ImportError:  # Dépendance optionnelle
+    aiohttp = None
+
+from config import (
+    API_BASE_URL, GEOCODING_URL, AIR_QUALITY_URL,
+    HTTP_POOL_MAXSIZE, HTTP_DEFAULT_TIMEOUT, HTTP_TIMEOUTS,
+    ASYNC_MAX_CONCURRENCY, RATE_LIMIT_MAX_WAIT, RETRYABLE_STATUS
+)
+from weather_api import ApiError, WeatherAPI
+from rate_limiter import parse_retry_after
+from resilience import backoff_delay, get_circuit_breaker, get_retry_budget
+from unit_conversion import convert_weather_data
+
+
+class AsyncWeatherAPI:
+    """Classe pour gérer les appels API météo de façon asynchrone"""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        pool_size: int = HTTP_POOL_MAXSIZE,
+        timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+        base_url: str = API_BASE_URL,
+        geocoding_url: str = GEOCODING_URL,
+        air_quality_url: str = AIR_QUALITY_URL
+    ):
+        self.base_url = base_url
+        self.geocoding_url = geocoding_url
+        self.air_quality_url = air_quality_url
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.pool_size = pool_size
+        self.timeouts = timeouts if timeouts is not None else HTTP_TIMEOUTS
+        self.max_concurrency = max_concurrency
+        self.last_error: Optional[ApiError] = None
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncWeatherAPI":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Fermer la session HTTP et ses connexions"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_session(self):
+        """
+        Obtenir (ou créer) la session aiohttp du client
+
+        Returns:
+            Session aiohttp avec pool keep-alive par hôte
+        """
+        if aiohttp is None:
+            raise ImportError("Module 'aiohttp' manquant : pip install aiohttp")
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.pool_size
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'Accept': 'application/json'},
+                cookie_jar=aiohttp.DummyCookieJar()
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    def _get_timeout(self, url: str):
+        """Délais (connexion, lecture) configurés pour l'hôte"""
+        host = urlparse(url).hostname or ''
+        connect, read = self.timeouts.get(host, HTTP_DEFAULT_TIMEOUT)
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+    async def _wait_before_retry(self, attempt: int, retry_after: Optional[float] = None) -> bool:
+        """
+        Attendre (sans bloquer) avant une nouvelle tentative, si elle est autorisée
+
+        Args:
+            attempt: Numéro de la tentative échouée (0 pour la première)
+            retry_after: Délai imposé par le serveur (Retry-After)
+
+        Returns:
+            True si une nouvelle tentative doit suivre
+        """
+        if attempt >= self.max_retries - 1 or not get_retry_budget().try_spend():
+            return False
+        await asyncio.sleep(backoff_delay(attempt, self.retry_delay, retry_after=retry_after))
+        return True
+
+    async def _make_request(self, url: str, params: Dict[str, Any]) -> Optional[Dict]:
+        """
+        Effectue une requête HTTP avec retry automatique (non bloquant)
+
+        Partage le disjoncteur et le budget de retry de WeatherAPI ; les
+        réponses 429 et 5xx sont retentées après `Retry-After` ou un délai
+        exponentiel avec aléa, comme dans WeatherAPI._send_request.
+
+        Args:
+            url: URL de l'API
+            params: Paramètres de la requête
+
+        Returns:
+            Données JSON ou None en cas d'erreur
+        """
+        session = await self._get_session()
+        breaker = get_circuit_breaker(url)
+        get_retry_budget().record_request()
+
+        for attempt in range(self.max_retries):
+            if not breaker.allow():
+                self.last_error = ApiError(
+                    'circuit_open', "🔌 Service Open-Meteo momentanément indisponible.", retry_in=breaker.retry_in()
+                )
+                return None
+            try:
+                async with self._semaphore:
+                    async with session.get(url, params=params, timeout=self._get_timeout(url)) as response:
+                        status = response.status
+                        if status not in RETRYABLE_STATUS:
+                            breaker.record_success()
+                            response.raise_for_status()
+                            return await response.json(content_type=None)
+                        if status != 429:
+                            breaker.record_failure()
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                # Attente hors sémaphore : la place est rendue aux autres requêtes
+                if status == 429 and retry_after is not None and retry_after > RATE_LIMIT_MAX_WAIT:
+                    self.last_error = ApiError(
+                        'rate_limited',
+                        f"🚦 Trop de requêtes vers Open-Meteo. Réessayez dans {retry_after:.0f} s.",
+                        status=status, retry_in=retry_after
+                    )
+                    return None
+                if await self._wait_before_retry(attempt, retry_after):
+                    continue
+                if status == 429:
+                    self.last_error = ApiError(
+                        'rate_limited', "🚦 Trop de requêtes vers Open-Meteo. Veuillez réessayer plus tard.", status=status
+                    )
+                else:
+                    self.last_error = ApiError('http', f"❌ Erreur HTTP: {status}", status=status)
+                return None
+            except asyncio.TimeoutError:
+                breaker.record_failure()
+                if await self._wait_before_retry(attempt):
+                    continue
+                self.last_error = ApiError('timeout', "⏱️ Délai d'attente dépassé. Veuillez réessayer.")
+                return None
+            except aiohttp.ClientResponseError as e:
+                self.last_error = ApiError('http', f"❌ Erreur HTTP: {e.status} {e.message}", status=e.status)
+                return None
+            except aiohttp.ClientConnectionError:
+                breaker.record_failure()
+                if await self._wait_before_retry(attempt):
+                    continue
+                self.last_error = ApiError('connection', "🌐 Erreur de connexion. Vérifiez votre connexion Internet.")
+                return None
+            except Exception as e:
+                self.last_error = ApiError('unexpected', f"❌ Erreur inattendue: {e}")
+                return None
+        return None
+
+    async def get_coordinates(self, city_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtenir les coordonnées d'une ville
+
+        Args:
+            city_name: Nom de la ville
+
+        Returns:
+            Dictionnaire avec lat, lon, name, country, timezone
+        """
+        data = await self._make_request(
+            self.geocoding_url,
+            WeatherAPI._geocoding_params(city_name)
+        )
+
+        coords = WeatherAPI._parse_coordinates(data)
+        if coords is None and data is not None:
+            # Sans réponse, l'erreur réseau est déjà dans last_error
+            self.last_error = ApiError('not_found', f"🔍 Ville '{city_name}' non trouvée.", level='warning')
+        return coords
+
+    async def get_weather_data(
+        self,
+        lat: float,
+        lon: float,
+        days: int = 7,
+        units: str = "metric"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Récupérer les données météo
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            days: Nombre de jours de prévisions (1-16)
+            units: Système d'unités ("metric" ou "imperial")
+
+        Returns:
+            Données météo complètes
+        """
+        data = await self._make_request(
+            self.base_url,
+            WeatherAPI._weather_params(lat, lon, days)
+        )
+
+        if data and WeatherAPI._validate_weather_data(data):
+            return convert_weather_data(WeatherAPI._slice_forecast(data, days), units)
+
+        if data is not None:
+            # Sans réponse, l'erreur réseau est déjà dans last_error
+            self.last_error = ApiError('invalid_data', "❌ Données météo invalides ou incomplètes.")
+        return None
+
+    async def get_air_quality(self, lat: float, lon: float) -> Optional[Dict[str, Any]]:
+        """
+        Récupérer l'indice de qualité de l'air
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            Données de qualité de l'air
+        """
+        data = await self._make_request(
+            self.air_quality_url,
+            WeatherAPI._air_quality_params(lat, lon)
+        )
+        return data if data else {'current': {}}
+
+    async def get_multiple_cities_data(
+        self,
+        city_names: list,
+        days: int = 7,
+        units: str = "metric"
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Récupérer les données pour plusieurs villes en parallèle
+
+        Args:
+            city_names: Liste des noms de villes
+            days: Nombre de jours de prévisions
+            units: Système d'unités
+
+        Returns:
+            Dictionnaire {ville: données_météo}
+        """
+        async def fetch_city(city: str) -> Optional[Dict]:
+            coords = await self.get_coordinates(city)
+            if not coords:
+                return None
+            weather, aqi = await asyncio.gather(
+                self.get_weather_data(coords['lat'], coords['lon'], days, units),
+                self.get_air_quality(coords['lat'], coords['lon'])
+            )
+            return {'coords': coords, 'weather': weather, 'aqi': aqi}
+
+        # L'annulation de l'appelant se propage à toutes les requêtes en cours
+        outcomes = await asyncio.gather(
+            *(fetch_city(city) for city in city_names),
+            return_exceptions=True
+        )
+
+        return {
+            city: None if isinstance(outcome, BaseException) else outcome
+            for city, outcome in zip(city_names, outcomes)
+        }
@@ -0,0 +1,161 @@
+"""
+Benchmark des graphiques : graph_objects seuls vs plotly.express
+
+Mesure le temps de construction de chaque figure (cache de figures
+contourné) et le temps d'import, avec l'ancienne implémentation
+plotly.express comme référence.
+
+Usage (depuis la racine du dépôt) :
+
+    python benchmarks/bench_charts.py [--repeat 50]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import charts
+from weather_analyzer import WeatherAnalyzer
+
+
+def sample_daily(days: int = 16) -> dict:
+    """Données quotidiennes synthétiques au format Open-Meteo"""
+    rng = np.random.default_rng(42)
+    dates = np.datetime64('2024-01-01') + np.arange(days)
+    t_max = rng.uniform(15, 35, days).round(1)
+    return {
+        'time': [str(d) for d in dates],
+        'temperature_2m_max': t_max.tolist(),
+        'temperature_2m_min': (t_max - rng.uniform(5, 12, days)).round(1).tolist(),
+        'precipitation_sum': rng.exponential(2, days).round(1).tolist(),
+        'precipitation_probability_max': rng.integers(0, 100, days).tolist(),
+        'wind_speed_10m_max': rng.uniform(5, 40, days).round(1).tolist(),
+        'weather_code': rng.choice([0, 1, 2, 3, 61, 80], days).tolist(),
+        'uv_index_max': rng.uniform(0, 11, days).round(1).tolist()
+    }
+
+
+def sample_hourly(hours: int = 48) -> dict:
+    """Données horaires synthétiques au format Open-Meteo"""
+    rng = np.random.default_rng(42)
+    times = np.datetime64('2024-01-01T00:00') + np.arange(hours).astype('timedelta64[h]')
+    return {
+        'time': [str(t) for t in times],
+        'temperature_2m': rng.uniform(10, 30, hours).round(1).tolist(),
+        'precipitation': rng.exponential(0.5, hours).round(1).tolist(),
+        'precipitation_probability': rng.integers(0, 100, hours).tolist(),
+        'wind_speed_10m': rng.uniform(5, 40, hours).round(1).tolist(),
+        'relative_humidity_2m': rng.integers(30, 100, hours).tolist()
+    }
+
+
+def express_builders():
+    """Anciennes implémentations plotly.express (référence « avant »)"""
+    import plotly.express as px
+
+    def layout(fig, theme, **kwargs):
+        fig.update_layout(
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white' if theme == 'dark' else 'black'),
+            margin=dict(l=20, r=20, t=50, b=20),
+            **kwargs
+        )
+        return fig
+
+    def precipitation(df, theme='dark'):
+        fig = px.bar(df, x='Date', y='Précipitations', title='💧 Précipitations Quotidiennes',
+                     template=charts.get_chart_template(theme))
+        fig.update_traces(marker_color='#1E88E5')
+        return layout(fig, theme, yaxis_title='Précipitations (mm)')
+
+    def wind(df, theme='dark'):
+        fig = px.area(df, x='Date', y='Vent_Max', title='💨 Vitesse du Vent',
+                      template=charts.get_chart_template(theme))
+        fig.update_traces(line_color='#00C853', fillcolor='rgba(0, 200, 83, 0.2)')
+        return layout(fig, theme, yaxis_title='Vitesse (km/h)')
+
+    def correlation(df, theme='dark'):
+        corr_data = df[['Temp_Max', 'Temp_Min', 'Précipitations', 'Vent_Max']].corr()
+        fig = px.imshow(corr_data, text_auto='.2f', aspect='auto', color_continuous_scale='RdBu_r',
+                        template=charts.get_chart_template(theme), title='🔗 Matrice de Corrélation')
+        return layout(fig, theme)
+
+    return {
+        'create_precipitation_chart': precipitation,
+        'create_wind_chart': wind,
+        'create_correlation_matrix': correlation
+    }
+
+
+def time_builder(builder, data, repeat: int) -> float:
+    """Temps médian de construction d'une figure (ms)"""
+    builder(data, 'dark')  # Échauffement (templates, validateurs)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        builder(data, 'dark')
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def import_time(statement: str) -> float:
+    """Temps d'import cumulé (ms) mesuré dans un interpréteur neuf via -X importtime"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=root, capture_output=True, text=True, check=True
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[0].startswith('import time:') and parts[1].strip().isdigit():
+            # Modules de premier niveau uniquement (cumul de leurs dépendances)
+            if not parts[2].startswith('  '):
+                total += int(parts[1])
+    return total / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    df, _ = WeatherAnalyzer.analyze_daily_data(sample_daily())
+    hourly = sample_hourly()
+    reference = express_builders()
+
+    # __wrapped__ : fonction d'origine, sans le cache de figures
+    hourly_forecast = charts.create_hourly_forecast.__wrapped__
+    timed = [
+        (name, getattr(charts, name).__wrapped__, df)
+        for name in ('create_temperature_chart', 'create_precipitation_chart',
+                     'create_wind_chart', 'create_correlation_matrix')
+    ]
+    timed.append((
+        'create_hourly_forecast',
+        lambda data, theme: hourly_forecast(data, 24, theme),
+        hourly
+    ))
+
+    print(f"{'Figure':<30} {'express (ms)':>13} {'graph_objects (ms)':>19}")
+    for name, builder, data in timed:
+        after = time_builder(builder, data, args.repeat)
+        before = time_builder(reference[name], data, args.repeat) if name in reference else after
+        print(f"{name:<30} {before:>13.2f} {after:>19.2f}")
+
+    print()
+    print(f"Import plotly.graph_objects   : {import_time('import plotly.graph_objects'):8.1f} ms")
+    print(f"Import + plotly.express       : {import_time('import plotly.graph_objects, plotly.express'):8.1f} ms")
+    print(f"Import charts (pandas inclus) : {import_time('import charts'):6.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
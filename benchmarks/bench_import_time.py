@@ -0,0 +1,121 @@
+"""
+Rapport du temps d'import du point d'entrée Streamlit (démarrage à froid)
+
+Importe `app` dans un interpréteur neuf avec `-X importtime`, puis affiche
+le temps total, les modules les plus coûteux et les dépendances lourdes
+chargées dès le démarrage (elles doivent l'être à la demande).
+
+Usage (depuis la racine du dépôt) :
+
+    python benchmarks/bench_import_time.py [--module app] [--top 15] [--budget-ms 1500]
+
+Avec --budget-ms, le script échoue (code 1) si le budget est dépassé.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules qui ne doivent pas être chargés au démarrage
+LAZY_MODULES = [
+    'plotly.graph_objects', 'plotly.express', 'charts', 'export_utils', 'reportlab', 'PIL.Image'
+]
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Analyser la sortie de `-X importtime`
+
+    Args:
+        stderr: Sortie d'erreur de l'interpréteur
+
+    Returns:
+        Liste (module, temps propre µs, temps cumulé µs, profondeur)
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Ligne d'en-tête
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(parts[0]), int(parts[1]), depth))
+    return entries
+
+
+def top_level_parents(entries: List[Tuple[str, int, int, int]]) -> Dict[str, str]:
+    """
+    Associer chaque module à la dépendance directe du module mesuré qui l'a importé
+
+    Args:
+        entries: Résultat de parse_importtime (ordre post-fixe : enfants d'abord)
+
+    Returns:
+        Dictionnaire {module: dépendance directe}
+    """
+    parents = {}
+    pending = []
+    for name, _, _, depth in entries:
+        if depth <= 1:
+            for child in pending:
+                parents[child] = name
+            pending = []
+            parents[name] = name
+        else:
+            pending.append(name)
+    return parents
+
+
+def measure(module: str) -> List[Tuple[str, int, int, int]]:
+    """Importer un module dans un interpréteur neuf et collecter les temps"""
+    # Pré-chauffage désactivé : seul le coût des imports est mesuré, sans réseau
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True,
+        env={**os.environ, 'METEO_PREWARM': '0'}
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Échec de l'import de {module}:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--module', default='app')
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    entries = measure(args.module)
+    loaded: Dict[str, int] = {name: cumulative for name, _, cumulative, _ in entries}
+    total_ms = loaded.get(args.module, 0) / 1000
+    parents = top_level_parents(entries)
+
+    print(f"Import de '{args.module}' : {total_ms:.1f} ms ({len(entries)} modules)")
+    print()
+    print(f"{'Module':<45} {'propre (ms)':>12} {'cumulé (ms)':>12}")
+    for name, self_us, cumulative, _ in sorted(entries, key=lambda e: e[2], reverse=True)[:args.top]:
+        print(f"{name:<45} {self_us / 1000:>12.1f} {cumulative / 1000:>12.1f}")
+
+    print()
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    if eager:
+        print("Dépendances lourdes chargées au démarrage : " + ", ".join(
+            f"{name} ({loaded[name] / 1000:.1f} ms, via {parents.get(name, '?')})" for name in eager
+        ))
+    else:
+        print("Aucune dépendance lourde chargée au démarrage : " + ", ".join(LAZY_MODULES))
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"Budget dépassé : {total_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
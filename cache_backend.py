@@ -0,0 +1,240 @@
+"""
+Cache des réponses API météo (clé → payload JSON avec expiration)
+
+Deux backends interchangeables :
+- MemoryCache : LRU en mémoire, propre au processus
+- SQLiteCache : fichier SQLite partagé entre processus (réplicas, redémarrages)
+"""
+
+from collections import OrderedDict
+from typing import Any, Optional
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from config import (
+    CACHE_BACKEND, CACHE_SQLITE_PATH, CACHE_MAX_ENTRIES, CACHE_MAX_BYTES
+)
+
+
+class MemoryCache:
+    """Cache mémoire LRU thread-safe avec expiration par entrée"""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Lire une entrée non expirée
+
+        Args:
+            key: Clé de cache
+
+        Returns:
+            Valeur stockée ou None si absente/expirée
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Enregistrer une entrée
+
+        Args:
+            key: Clé de cache
+            value: Valeur à stocker
+            ttl: Durée de vie en secondes
+        """
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            # Éviction des entrées les moins récemment utilisées
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Vider le cache"""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    """Cache disque SQLite partageable entre processus, borné en taille"""
+
+    # Intervalle minimal entre deux mises à jour de la date d'accès (LRU)
+    TOUCH_INTERVAL = 60
+
+    def __init__(
+        self,
+        path: str = CACHE_SQLITE_PATH,
+        max_bytes: int = CACHE_MAX_BYTES,
+        max_entries: int = CACHE_MAX_ENTRIES
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON entries (accessed_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_expires ON entries (expires_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Obtenir la connexion SQLite du thread courant
+
+        Returns:
+            Connexion ouverte en mode WAL (lectures concurrentes entre processus)
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Lire une entrée non expirée
+
+        Args:
+            key: Clé de cache
+
+        Returns:
+            Valeur stockée ou None si absente/expirée
+        """
+        now = time.time()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at, accessed_at FROM entries WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None or row[1] < now:
+                return None
+            if now - row[2] > self.TOUCH_INTERVAL:
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError):
+            # Un cache indisponible ne doit jamais bloquer l'application
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Enregistrer une entrée puis appliquer l'éviction
+
+        Args:
+            key: Clé de cache
+            value: Valeur JSON-sérialisable
+            ttl: Durée de vie en secondes
+        """
+        now = time.time()
+        try:
+            payload = json.dumps(value, separators=(',', ':'))
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, len(payload), now + ttl, now)
+                )
+                self._evict(conn, now)
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """
+        Supprimer les entrées expirées puis les moins récemment utilisées
+
+        Args:
+            conn: Connexion dans une transaction ouverte
+            now: Horodatage courant
+        """
+        conn.execute("DELETE FROM entries WHERE expires_at < ?", (now,))
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        rows = conn.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall()
+        victims = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def clear(self) -> None:
+        """Vider le cache"""
+        try:
+            self._connect().execute("DELETE FROM entries")
+        except sqlite3.Error:
+            pass
+
+
+_DEFAULT_CACHE = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def create_cache(backend: str = CACHE_BACKEND):
+    """
+    Créer un backend de cache
+
+    Args:
+        backend: 'sqlite' (partagé entre processus) ou 'memory'
+
+    Returns:
+        Instance de cache
+    """
+    if backend == 'sqlite':
+        try:
+            return SQLiteCache()
+        except (sqlite3.Error, OSError):
+            # Disque en lecture seule ou inaccessible : repli en mémoire
+            return MemoryCache()
+    if backend == 'memory':
+        return MemoryCache()
+    raise ValueError(f"Backend de cache non supporté: {backend}")
+
+
+def get_default_cache():
+    """
+    Obtenir le cache partagé du processus (backend défini par CACHE_BACKEND)
+
+    Returns:
+        Instance de cache commune
+    """
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        with _DEFAULT_CACHE_LOCK:
+            if _DEFAULT_CACHE is None:
+                _DEFAULT_CACHE = create_cache()
+    return _DEFAULT_CACHE
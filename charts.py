@@ -1,11 +1,78 @@
 """
 Fonctions pour créer des graphiques Plotly interactifs
+
+Toutes les figures sont construites directement avec `plotly.graph_objects` :
+`plotly.express` n'est jamais importé (import lourd, surcoût à chaque appel).
+
+Les figures sont mémoïsées par empreinte des données et paramètres
+(dont le thème) : un rerun avec des données inchangées réutilise la
+figure déjà construite. Les figures renvoyées sont partagées et ne
+doivent pas être modifiées.
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
-from typing import Dict, Any, List
+import numpy as np
+import functools
+import hashlib
+import json
+from typing import Callable, Dict, Any, List
+
+from cache_backend import MemoryCache
+from config import FIGURE_CACHE_MAX_ENTRIES
+from forecast_frame import ForecastBlock
+
+_FIGURE_CACHE = MemoryCache(max_entries=FIGURE_CACHE_MAX_ENTRIES)
+
+
+def data_fingerprint(data: Any) -> str:
+    """
+    Calculer l'empreinte du contenu d'un jeu de données
+
+    Args:
+        data: DataFrame, ForecastBlock ou dictionnaire JSON
+
+    Returns:
+        Empreinte SHA-1 hexadécimale
+    """
+    digest = hashlib.sha1()
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr(list(data.columns)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+    elif isinstance(data, ForecastBlock):
+        for field, column in data.columns.items():
+            digest.update(f"{field}:{column.dtype.str}:".encode('utf-8'))
+            digest.update(np.ascontiguousarray(column).tobytes())
+    else:
+        digest.update(json.dumps(data, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def cached_figure(builder: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+    """
+    Mémoïser une fonction de graphique (premier argument = données)
+
+    Args:
+        builder: Fonction construisant la figure
+
+    Returns:
+        Fonction équivalente servie depuis le cache de figures
+    """
+    @functools.wraps(builder)
+    def wrapper(data: Any, *args, **kwargs) -> go.Figure:
+        key = f"{builder.__name__}:{data_fingerprint(data)}:{args!r}:{sorted(kwargs.items())!r}"
+        fig = _FIGURE_CACHE.get(key)
+        if fig is None:
+            fig = builder(data, *args, **kwargs)
+            _FIGURE_CACHE.set(key, fig, float('inf'))
+        return fig
+
+    return wrapper
+
+
+def clear_figure_cache() -> None:
+    """Vider le cache de figures"""
+    _FIGURE_CACHE.clear()
 
 
 def get_chart_template(theme: str = 'dark') -> str:
@@ -21,6 +88,7 @@ def get_chart_template(theme: str = 'dark') -> str:
     return 'plotly_dark' if theme == 'dark' else 'plotly_white'
 
 
+@cached_figure
 def create_temperature_chart(df: pd.DataFrame, theme: str = 'dark') -> go.Figure:
     """
     Créer un graphique de température
@@ -71,6 +139,7 @@ def create_temperature_chart(df: pd.DataFrame, theme: str = 'dark') -> go.Figure
     return fig
 
 
+@cached_figure
 def create_precipitation_chart(df: pd.DataFrame, theme: str = 'dark') -> go.Figure:
     """
     Créer un graphique de précipitations
@@ -82,27 +151,31 @@ def create_precipitation_chart(df: pd.DataFrame, theme: str = 'dark') -> go.Figu
     Returns:
         Figure Plotly
     """
-    fig = px.bar(
-        df,
-        x='Date',
-        y='Précipitations',
-        title='💧 Précipitations Quotidiennes',
-        template=get_chart_template(theme)
-    )
+    fig = go.Figure(go.Bar(
+        x=df['Date'],
+        y=df['Précipitations'],
+        name='',
+        marker_color='#1E88E5',
+        showlegend=False,
+        hovertemplate='Date=%{x}<br>Précipitations=%{y}<extra></extra>'
+    ))
     
     fig.update_layout(
+        title='💧 Précipitations Quotidiennes',
+        xaxis_title='Date',
+        yaxis_title='Précipitations (mm)',
+        template=get_chart_template(theme),
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
         font=dict(color='white' if theme == 'dark' else 'black'),
         margin=dict(l=20, r=20, t=50, b=20),
-        yaxis_title='Précipitations (mm)'
+        barmode='relative'
     )
     
-    fig.update_traces(marker_color='#1E88E5')
-    
     return fig
 
 
+@cached_figure
 def create_wind_chart(df: pd.DataFrame, theme: str = 'dark') -> go.Figure:
     """
     Créer un graphique de vent
@@ -114,33 +187,39 @@ def create_wind_chart(df: pd.DataFrame, theme: str = 'dark') -> go.Figure:
     Returns:
         Figure Plotly
     """
-    fig = px.area(
-        df,
-        x='Date',
-        y='Vent_Max',
-        title='💨 Vitesse du Vent',
-        template=get_chart_template(theme)
-    )
+    fig = go.Figure(go.Scatter(
+        x=df['Date'],
+        y=df['Vent_Max'],
+        name='',
+        mode='lines',
+        stackgroup='1',
+        line_color='#00C853',
+        fillcolor='rgba(0, 200, 83, 0.2)',
+        showlegend=False,
+        hovertemplate='Date=%{x}<br>Vent_Max=%{y}<extra></extra>'
+    ))
     
     fig.update_layout(
+        title='💨 Vitesse du Vent',
+        xaxis_title='Date',
+        yaxis_title='Vitesse (km/h)',
+        template=get_chart_template(theme),
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
         font=dict(color='white' if theme == 'dark' else 'black'),
-        margin=dict(l=20, r=20, t=50, b=20),
-        yaxis_title='Vitesse (km/h)'
+        margin=dict(l=20, r=20, t=50, b=20)
     )
     
-    fig.update_traces(line_color='#00C853', fillcolor='rgba(0, 200, 83, 0.2)')
-    
     return fig
 
 
+@cached_figure
 def create_hourly_forecast(hourly_data: Dict[str, Any], hours: int = 24, theme: str = 'dark') -> go.Figure:
     """
     Créer un graphique des prévisions horaires
     
     Args:
-        hourly_data: Données horaires de l'API
+        hourly_data: Données horaires (fenêtre ForecastFrame.hourly_window ou JSON de l'API)
         hours: Nombre d'heures à afficher
         theme: Thème du graphique
         
@@ -207,6 +286,7 @@ def create_hourly_forecast(hourly_data: Dict[str, Any], hours: int = 24, theme:
 
 
 
+@cached_figure
 def create_correlation_matrix(df: pd.DataFrame, theme: str = 'dark') -> go.Figure:
     """
     Créer une matrice de corrélation
@@ -220,16 +300,20 @@ def create_correlation_matrix(df: pd.DataFrame, theme: str = 'dark') -> go.Figur
     """
     corr_data = df[['Temp_Max', 'Temp_Min', 'Précipitations', 'Vent_Max']].corr()
     
-    fig = px.imshow(
-        corr_data,
-        text_auto='.2f',
-        aspect='auto',
-        color_continuous_scale='RdBu_r',
-        template=get_chart_template(theme),
-        title='🔗 Matrice de Corrélation'
-    )
+    fig = go.Figure(go.Heatmap(
+        z=corr_data.values,
+        x=list(corr_data.columns),
+        y=list(corr_data.index),
+        coloraxis='coloraxis',
+        texttemplate='%{z:.2f}',
+        hovertemplate='x: %{x}<br>y: %{y}<br>color: %{z}<extra></extra>'
+    ))
     
     fig.update_layout(
+        title='🔗 Matrice de Corrélation',
+        template=get_chart_template(theme),
+        coloraxis=dict(colorscale='RdBu_r'),
+        yaxis=dict(autorange='reversed'),
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
         font=dict(color='white' if theme == 'dark' else 'black'),
@@ -2,6 +2,8 @@
 Configuration centralisée pour l'application météo
 """
 
+import os
+
 # URLs des APIs
 API_BASE_URL = "https://api.open-meteo.com/v1/forecast"
 GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
@@ -11,6 +13,68 @@ AIR_QUALITY_URL = "https://air-quality-api.open-meteo.com/v1/air-quality"
 CACHE_TTL_WEATHER = 900  # 15 minutes
 CACHE_TTL_GEOCODING = 3600  # 1 heure
 CACHE_TTL_AIR_QUALITY = 3600  # 1 heure
+# Stale-while-revalidate : au-delà de CACHE_TTL_WEATHER, la prévision en cache est
+# servie immédiatement et rafraîchie en arrière-plan, jusqu'à l'expiration ferme
+CACHE_STALE_WHILE_REVALIDATE = os.environ.get("METEO_STALE_WHILE_REVALIDATE", "1") == "1"
+CACHE_HARD_TTL_WEATHER = int(os.environ.get("METEO_HARD_TTL_WEATHER", 6 * 3600))  # 6 heures
+CACHE_MAX_ENTRIES = 2048  # Entrées conservées par le cache des réponses API
+CACHE_MAX_BYTES = 256 * 1024 * 1024  # Taille maximale du cache disque (256 Mo)
+# Backend du cache : "sqlite" (partagé entre processus) ou "memory"
+CACHE_BACKEND = os.environ.get("METEO_CACHE_BACKEND", "sqlite")
+CACHE_SQLITE_PATH = os.environ.get(
+    "METEO_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "weather_cache.sqlite3")
+)
+
+# Configuration du transport HTTP (pool de connexions partagé, keep-alive)
+HTTP_POOL_CONNECTIONS = 10  # Nombre de pools d'hôtes conservés
+HTTP_POOL_MAXSIZE = 20  # Connexions keep-alive par hôte
+HTTP_DEFAULT_TIMEOUT = (3.05, 10)  # (connexion, lecture) en secondes
+HTTP_TIMEOUTS = {
+    "api.open-meteo.com": (3.05, 10),
+    "geocoding-api.open-meteo.com": (3.05, 5),
+    "air-quality-api.open-meteo.com": (3.05, 10)
+}
+
+# Limites de débit par endpoint : (requêtes/s, rafale, requêtes simultanées)
+# Usage gratuit Open-Meteo : 600 appels/min, 5 000/h, 10 000/jour
+RATE_LIMITS = {
+    "api.open-meteo.com": (5.0, 50, 8),
+    "geocoding-api.open-meteo.com": (2.0, 10, 4),
+    "air-quality-api.open-meteo.com": (5.0, 50, 8)
+}
+RATE_LIMIT_DEFAULT = (2.0, 10, 4)
+RATE_LIMIT_MAX_WAIT = 30  # Attente maximale avant d'abandonner une requête (secondes)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}  # Réponses HTTP justifiant une nouvelle tentative
+
+# Résilience des appels amont (délai exponentiel avec aléa, disjoncteur, budget de retry)
+RETRY_MAX_DELAY = 8.0  # Plafond du délai entre deux tentatives (secondes)
+CIRCUIT_FAILURE_THRESHOLD = 5  # Échecs consécutifs avant ouverture du disjoncteur
+CIRCUIT_RECOVERY_TIMEOUT = 30  # Durée d'ouverture avant un essai de rétablissement (secondes)
+RETRY_BUDGET_RATIO = 0.2  # Nouvelles tentatives autorisées : 20 % du trafic
+RETRY_BUDGET_MIN_PER_SECOND = 1.0  # Plancher à faible trafic (tentatives par seconde)
+
+# Requêtes simultanées maximales pour les récupérations multi-villes
+FETCH_MAX_WORKERS = 8
+
+# Positions maximales par requête multi-coordonnées Open-Meteo
+BATCH_MAX_LOCATIONS = 50
+
+# Rafraîchissements simultanés maximaux en arrière-plan (stale-while-revalidate)
+BACKGROUND_MAX_WORKERS = 4
+
+# Requêtes simultanées maximales pour le client asynchrone
+ASYNC_MAX_CONCURRENCY = 200
+
+# Cache des fichiers exportés (CSV/JSON/PDF générés à la demande)
+EXPORT_CACHE_MAX_ENTRIES = 32
+EXPORT_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 32 Mo
+
+# Figures Plotly mémoïsées (clé : empreinte des données + thème)
+FIGURE_CACHE_MAX_ENTRIES = 64
+
+# Développement : recharger weather_analyzer à chaque rerun (METEO_DEV_RELOAD=1)
+DEV_HOT_RELOAD = os.environ.get("METEO_DEV_RELOAD", "0") == "1"
 
 # Villes prédéfinies
 PREDEFINED_CITIES = [
@@ -20,6 +84,47 @@ PREDEFINED_CITIES = [
     "Toronto", "Los Angeles", "Singapore", "Mumbai", "Beijing"
 ]
 
+# Coordonnées fixes des villes prédéfinies (aucun appel de géocodage nécessaire)
+PREDEFINED_CITY_COORDS = {
+    "Casablanca": {"lat": 33.58831, "lon": -7.61138, "name": "Casablanca", "country": "Maroc", "timezone": "Africa/Casablanca"},
+    "Rabat": {"lat": 34.01325, "lon": -6.83255, "name": "Rabat", "country": "Maroc", "timezone": "Africa/Casablanca"},
+    "Marrakech": {"lat": 31.63416, "lon": -7.99994, "name": "Marrakech", "country": "Maroc", "timezone": "Africa/Casablanca"},
+    "Fès": {"lat": 34.03313, "lon": -4.99980, "name": "Fès", "country": "Maroc", "timezone": "Africa/Casablanca"},
+    "Tanger": {"lat": 35.76727, "lon": -5.79975, "name": "Tanger", "country": "Maroc", "timezone": "Africa/Casablanca"},
+    "Agadir": {"lat": 30.42018, "lon": -9.59815, "name": "Agadir", "country": "Maroc", "timezone": "Africa/Casablanca"},
+    "Mohammedia": {"lat": 33.68607, "lon": -7.38298, "name": "Mohammédia", "country": "Maroc", "timezone": "Africa/Casablanca"},
+    "Paris": {"lat": 48.85341, "lon": 2.3488, "name": "Paris", "country": "France", "timezone": "Europe/Paris"},
+    "London": {"lat": 51.50853, "lon": -0.12574, "name": "Londres", "country": "Royaume-Uni", "timezone": "Europe/London"},
+    "New York": {"lat": 40.71427, "lon": -74.00597, "name": "New York", "country": "États-Unis", "timezone": "America/New_York"},
+    "Tokyo": {"lat": 35.6895, "lon": 139.69171, "name": "Tokyo", "country": "Japon", "timezone": "Asia/Tokyo"},
+    "Dubai": {"lat": 25.07725, "lon": 55.30927, "name": "Dubaï", "country": "Émirats arabes unis", "timezone": "Asia/Dubai"},
+    "Berlin": {"lat": 52.52437, "lon": 13.41053, "name": "Berlin", "country": "Allemagne", "timezone": "Europe/Berlin"},
+    "Madrid": {"lat": 40.4165, "lon": -3.70256, "name": "Madrid", "country": "Espagne", "timezone": "Europe/Madrid"},
+    "Rome": {"lat": 41.89193, "lon": 12.51133, "name": "Rome", "country": "Italie", "timezone": "Europe/Rome"},
+    "Cairo": {"lat": 30.06263, "lon": 31.24967, "name": "Le Caire", "country": "Égypte", "timezone": "Africa/Cairo"},
+    "Istanbul": {"lat": 41.01384, "lon": 28.94966, "name": "Istanbul", "country": "Turquie", "timezone": "Europe/Istanbul"},
+    "Moscow": {"lat": 55.75222, "lon": 37.61556, "name": "Moscou", "country": "Russie", "timezone": "Europe/Moscow"},
+    "Sydney": {"lat": -33.86785, "lon": 151.20732, "name": "Sydney", "country": "Australie", "timezone": "Australia/Sydney"},
+    "Toronto": {"lat": 43.70011, "lon": -79.4163, "name": "Toronto", "country": "Canada", "timezone": "America/Toronto"},
+    "Los Angeles": {"lat": 34.05223, "lon": -118.24368, "name": "Los Angeles", "country": "États-Unis", "timezone": "America/Los_Angeles"},
+    "Singapore": {"lat": 1.28967, "lon": 103.85007, "name": "Singapour", "country": "Singapour", "timezone": "Asia/Singapore"},
+    "Mumbai": {"lat": 19.07283, "lon": 72.88261, "name": "Mumbai", "country": "Inde", "timezone": "Asia/Kolkata"},
+    "Beijing": {"lat": 39.9075, "lon": 116.39723, "name": "Pékin", "country": "Chine", "timezone": "Asia/Shanghai"}
+}
+
+# Index local de géocodage (dictionnaire géographique fourni)
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "gazetteer.csv")
+GEOCODING_FUZZY_CUTOFF = 0.8  # Similarité minimale des suggestions en cas de faute de frappe (0-1)
+GEOCODING_SUGGESTION_LIMIT = 8  # Suggestions proposées pendant la saisie
+
+# Pré-chauffage du cache pour les villes prédéfinies (METEO_PREWARM=0 pour désactiver)
+PREWARM_ENABLED = os.environ.get("METEO_PREWARM", "1") == "1"
+PREWARM_FORECAST_DAYS = 14  # Horizon le plus long proposé par l'interface
+PREWARM_LEAD_TIME = 60  # Rafraîchir ~1 min avant l'expiration (secondes)
+PREWARM_JITTER = 60  # Aléa ajouté pour étaler les rafraîchissements (secondes)
+PREWARM_RETRY_DELAY = 15  # Nouvel essai d'une position en échec (doublé à chaque échec, plafonné à PREWARM_LEAD_TIME)
+PREWARM_STARTUP_WAIT = 5  # Attente maximale du premier passage pour une ville prédéfinie absente du cache (secondes)
+
 # Codes météo Open-Meteo
 WEATHER_CODES = {
     0: {"desc": "☀️ Ciel dégagé", "category": "sunny"},
@@ -92,6 +197,10 @@ WEATHER_GRADIENTS = {
 }
 
 
+# Variantes responsives des images d'arrière-plan (largeurs en pixels)
+BACKGROUND_VARIANT_WIDTHS = [640, 1280, 1920]
+BACKGROUND_VARIANT_QUALITY = {"webp": 78, "jpeg": 80}
+
 
 # Configuration de l'export PDF
 PDF_CONFIG = {
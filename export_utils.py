@@ -1,14 +1,24 @@
 """
 Utilitaires pour exporter les données météo
+
+Les exports sont générés à la demande (au clic sur le bouton de
+téléchargement) et mis en cache par contenu : un même rapport n'est
+produit qu'une fois tant que les données ne changent pas.
 """
 
 import pandas as pd
 import json
+import hashlib
+import threading
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Hashable
 from io import BytesIO
 
+from config import EXPORT_CACHE_MAX_ENTRIES, EXPORT_CACHE_MAX_BYTES
+from forecast_frame import ForecastBlock, ForecastFrame
+
 
 def convert_numpy(obj: Any) -> Any:
     """
@@ -20,11 +30,16 @@ def convert_numpy(obj: Any) -> Any:
     Returns:
         Objet converti
     """
-    if isinstance(obj, np.integer):
+    if isinstance(obj, (ForecastBlock, ForecastFrame)):
+        return obj.to_dict()
+    elif isinstance(obj, np.integer):
         return int(obj)
     elif isinstance(obj, np.floating):
         if np.isnan(obj) or np.isinf(obj):
             return None
+        if isinstance(obj, np.float32):
+            # Représentation la plus courte : 21.3 et non 21.299999237060547
+            return float(str(obj))
         return float(obj)
     elif isinstance(obj, float):
         if np.isnan(obj) or np.isinf(obj):
@@ -39,6 +54,118 @@ def convert_numpy(obj: Any) -> Any:
     return obj
 
 
+class ExportCache:
+    """Cache LRU thread-safe des exports générés, borné en nombre et en octets"""
+
+    def __init__(
+        self,
+        max_entries: int = EXPORT_CACHE_MAX_ENTRIES,
+        max_bytes: int = EXPORT_CACHE_MAX_BYTES
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: str, build: Callable[[], bytes]) -> bytes:
+        """
+        Obtenir un export, en le générant seulement s'il est absent
+
+        Args:
+            key: Clé de contenu (voir export_cache_key)
+            build: Fonction produisant les octets de l'export
+
+        Returns:
+            Octets de l'export
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                return data
+
+        # Génération hors verrou : un PDF ne bloque pas les autres téléchargements
+        data = build()
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = data
+                self._total_bytes += len(data)
+            self._entries.move_to_end(key)
+            # Éviction des exports les moins récemment téléchargés
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+        return data
+
+    def clear(self) -> None:
+        """Vider le cache"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+_EXPORT_CACHE = ExportCache()
+
+
+def export_cache_key(
+    city_info: Dict[str, Any],
+    data_version: Hashable,
+    stats: Dict[str, float],
+    format: str
+) -> str:
+    """
+    Calculer la clé de contenu d'un export
+
+    Args:
+        city_info: Informations sur la ville
+        data_version: Version des données météo (voir SessionManager)
+        stats: Statistiques calculées
+        format: Format de sortie ('csv', 'json', 'pdf')
+
+    Returns:
+        Empreinte SHA-1 hexadécimale
+    """
+    payload = json.dumps(
+        [convert_numpy(city_info), data_version, convert_numpy(stats), format],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def export_filename(prefix: str, city_name: str, extension: str) -> str:
+    """
+    Construire le nom du fichier exporté
+
+    Args:
+        prefix: Préfixe ('meteo', 'rapport_meteo')
+        city_name: Nom de la ville
+        extension: Extension sans point
+
+    Returns:
+        Nom de fichier horodaté
+    """
+    return f"{prefix}_{city_name}_{datetime.now().strftime('%Y%m%d_%H%M')}.{extension}"
+
+
+def get_export_bytes(key: str, build: Callable[[], bytes]) -> bytes:
+    """
+    Obtenir un export depuis le cache partagé du processus
+
+    Args:
+        key: Clé de contenu (voir export_cache_key)
+        build: Fonction produisant les octets de l'export
+
+    Returns:
+        Octets de l'export
+    """
+    return _EXPORT_CACHE.get_or_create(key, build)
+
+
 def export_to_csv(df: pd.DataFrame, city_name: str) -> tuple:
     """
     Exporter les données en CSV
@@ -51,7 +178,7 @@ def export_to_csv(df: pd.DataFrame, city_name: str) -> tuple:
         Tuple (données CSV, nom de fichier)
     """
     csv = df.to_csv(index=False, encoding='utf-8-sig')
-    filename = f"meteo_{city_name}_{datetime.now().strftime('%Y%m%d_%H%M')}.csv"
+    filename = export_filename('meteo', city_name, 'csv')
     return csv, filename
 
 
@@ -64,7 +191,7 @@ def export_to_json(
     Exporter en JSON
     
     Args:
-        weather_data: Données météo complètes
+        weather_data: Données météo complètes (ForecastFrame ou JSON de l'API)
         city_info: Informations sur la ville
         stats: Statistiques calculées
         
@@ -87,7 +214,7 @@ def export_to_json(
     }
     
     json_str = json.dumps(export_data, indent=2, ensure_ascii=False)
-    filename = f"meteo_{city_info['name']}_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
+    filename = export_filename('meteo', city_info['name'], 'json')
     return json_str, filename
 
 
@@ -214,7 +341,7 @@ def export_to_pdf(
         c.save()
         buffer.seek(0)
         
-        filename = f"rapport_meteo_{city_info['name']}_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
+        filename = export_filename('rapport_meteo', city_info['name'], 'pdf')
         return buffer, filename
         
     except Exception as e:
@@ -249,3 +376,37 @@ def generate_report(
         return export_to_pdf(city_info, weather_data['current'], df, stats)
     else:
         raise ValueError(f"Format non supporté: {format}")
+
+
+def pdf_export_available() -> bool:
+    """Vérifier si reportlab est installé (sans l'importer)"""
+    import importlib.util
+    return importlib.util.find_spec('reportlab') is not None
+
+
+def generate_report_bytes(
+    city_info: Dict[str, Any],
+    weather_data: Dict[str, Any],
+    df: pd.DataFrame,
+    stats: Dict[str, float],
+    format: str = 'json'
+) -> bytes:
+    """
+    Générer le contenu binaire d'un rapport (pour un téléchargement différé)
+
+    Args:
+        city_info: Informations sur la ville
+        weather_data: Données météo complètes
+        df: DataFrame avec prévisions
+        stats: Statistiques
+        format: Format de sortie ('csv', 'json', 'pdf')
+
+    Returns:
+        Octets du fichier
+    """
+    data, result = generate_report(city_info, weather_data, df, stats, format)
+    if data is None:
+        raise RuntimeError(result)
+    if isinstance(data, BytesIO):
+        return data.getvalue()
+    return data.encode('utf-8')
@@ -0,0 +1,108 @@
+"""
+Moteur de récupération concurrente pour les appels API multi-villes
+et les rafraîchissements en arrière-plan
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+import threading
+
+from config import FETCH_MAX_WORKERS, BACKGROUND_MAX_WORKERS
+
+# Tâche = (fonction, arguments positionnels)
+Task = Tuple[Callable[..., Any], Tuple[Any, ...]]
+
+
+def run_parallel(
+    tasks: Dict[Hashable, Task],
+    max_workers: int = FETCH_MAX_WORKERS
+) -> Dict[Hashable, Any]:
+    """
+    Exécuter des tâches en parallèle avec isolation des erreurs
+
+    Les threads du pool n'ont pas de contexte Streamlit : les tâches
+    signalent leurs erreurs sans les afficher (voir streamlit_adapter).
+
+    Args:
+        tasks: Dictionnaire {clé: (fonction, arguments)}
+        max_workers: Nombre maximal de requêtes simultanées
+
+    Returns:
+        Dictionnaire {clé: résultat}, None pour une tâche en échec
+    """
+    if not tasks:
+        return {}
+
+    # Une seule tâche : inutile de créer un pool
+    if len(tasks) == 1:
+        key, (func, args) = next(iter(tasks.items()))
+        try:
+            return {key: func(*args)}
+        except Exception:
+            return {key: None}
+
+    results: Dict[Hashable, Any] = {}
+    workers = max(1, min(max_workers, len(tasks)))
+
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix='weather-fetch'
+    ) as executor:
+        futures = {
+            key: executor.submit(func, *args)
+            for key, (func, args) in tasks.items()
+        }
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception:
+                # Une ville en échec ne doit pas bloquer les autres
+                results[key] = None
+
+    return results
+
+
+# Pool des rafraîchissements en arrière-plan (partagé par le processus)
+_BACKGROUND_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_BACKGROUND_PENDING: Set[Hashable] = set()
+_BACKGROUND_LOCK = threading.Lock()
+
+
+def submit_background(key: Hashable, func: Callable[..., Any], *args: Any) -> bool:
+    """
+    Lancer une tâche en arrière-plan, au plus une à la fois par clé
+
+    La tâche s'exécute hors de tout contexte Streamlit : elle ne doit pas
+    afficher d'éléments d'interface.
+
+    Args:
+        key: Clé de dédoublonnage (ex: clé de cache rafraîchie)
+        func: Fonction à exécuter
+        *args: Arguments positionnels
+
+    Returns:
+        True si la tâche a été soumise, False si la même clé est déjà en cours
+    """
+    global _BACKGROUND_EXECUTOR
+    with _BACKGROUND_LOCK:
+        if key in _BACKGROUND_PENDING:
+            return False
+        if _BACKGROUND_EXECUTOR is None:
+            _BACKGROUND_EXECUTOR = ThreadPoolExecutor(
+                max_workers=BACKGROUND_MAX_WORKERS,
+                thread_name_prefix='weather-refresh'
+            )
+        _BACKGROUND_PENDING.add(key)
+
+    def run():
+        try:
+            func(*args)
+        except Exception:
+            # Un rafraîchissement en échec laisse simplement la donnée périmée en place
+            pass
+        finally:
+            with _BACKGROUND_LOCK:
+                _BACKGROUND_PENDING.discard(key)
+
+    _BACKGROUND_EXECUTOR.submit(run)
+    return True
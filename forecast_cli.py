@@ -0,0 +1,435 @@
+"""
+Export en lot des prévisions météo, sans interface (rapports nocturnes)
+
+Usage (depuis la racine du dépôt) :
+
+    python forecast_cli.py villes.txt -o previsions.ndjson [--days 7] [--units metric]
+        [--format ndjson|csv|parquet] [--workers 8] [--batch-size 50] [--restart]
+
+Fichier d'entrée : une position par ligne, soit un nom de ville ("Fès",
+"Lyon, France"), soit des coordonnées "lat,lon" suivies d'un libellé
+optionnel ("33.59,-7.61,Casablanca"). Lignes vides et commentaires (#)
+ignorés.
+
+Les positions sont lues au fil de l'eau par lots (une requête
+multi-coordonnées par lot), avec au plus `--workers` lots en cours : chaque
+lot terminé est analysé (WeatherAnalyzer.analyze_daily_data) puis écrit
+aussitôt, une ligne par position et par jour. La mémoire reste constante
+quelle que soit la taille de la liste.
+
+Un point de reprise est enregistré après chaque lot écrit : relancer la
+même commande après un arrêt brutal reprend là où elle s'était arrêtée
+(`--restart` pour tout recommencer). En Parquet, la sortie est un dossier
+contenant un fichier par lot. Les positions en échec sont listées dans
+`<sortie>.failed.txt`, réutilisable comme fichier d'entrée.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import argparse
+import csv
+import glob
+import importlib.util
+import json
+import os
+import sys
+import time
+
+from config import BATCH_MAX_LOCATIONS, FETCH_MAX_WORKERS
+from cache_backend import MemoryCache
+from export_utils import convert_numpy
+from geocoding_index import format_place
+from weather_analyzer import WeatherAnalyzer
+from weather_api import WeatherAPI
+
+FORMATS = ('ndjson', 'csv', 'parquet')
+
+# Colonnes des lignes exportées (une par position et par jour)
+FIELDS = [
+    'location', 'latitude', 'longitude', 'date',
+    'Temp_Max', 'Temp_Min', 'Précipitations', 'Prob_Pluie', 'Vent_Max', 'Code_Météo', 'UV_Max'
+]
+
+# Ligne d'entrée = (numéro de ligne, texte)
+InputLine = Tuple[int, str]
+
+
+def parse_location(text: str) -> Dict[str, Any]:
+    """
+    Interpréter une ligne d'entrée
+
+    Args:
+        text: Nom de ville ou "lat,lon[,libellé]"
+
+    Returns:
+        Dictionnaire {query, name, lat, lon} (lat/lon absents pour un nom)
+    """
+    parts = [part.strip() for part in text.split(',')]
+    if len(parts) >= 2:
+        try:
+            lat, lon = float(parts[0]), float(parts[1])
+        except ValueError:
+            pass
+        else:
+            if -90 <= lat <= 90 and -180 <= lon <= 180:
+                name = ','.join(parts[2:]).strip() or f"{lat:.4f},{lon:.4f}"
+                return {'query': text, 'name': name, 'lat': lat, 'lon': lon}
+    return {'query': text, 'name': text}
+
+
+def read_locations(path: str) -> Iterator[InputLine]:
+    """
+    Lire les positions au fil de l'eau (sans charger tout le fichier)
+
+    Args:
+        path: Fichier d'entrée (UTF-8)
+
+    Yields:
+        Tuples (numéro de ligne, texte sans commentaire)
+    """
+    with open(path, encoding='utf-8') as handle:
+        for line_no, line in enumerate(handle, 1):
+            text = line.split('#', 1)[0].strip()
+            if text:
+                yield line_no, text
+
+
+def read_chunks(path: str, batch_size: int) -> Iterator[List[InputLine]]:
+    """Découper l'entrée en lots consécutifs de batch_size positions"""
+    lines = read_locations(path)
+    while True:
+        chunk = list(islice(lines, batch_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process_chunk(
+    chunk: List[InputLine],
+    days: int,
+    units: str,
+    cache: MemoryCache
+) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]:
+    """
+    Géocoder, récupérer et analyser un lot de positions
+
+    Args:
+        chunk: Lignes d'entrée du lot
+        days: Nombre de jours de prévisions
+        units: Système d'unités
+        cache: Cache mémoire borné partagé par les lots
+
+    Returns:
+        Tuple (lignes exportées, échecs [(texte, message)])
+    """
+    # Une instance par lot : last_error décrit les échecs de ce lot uniquement
+    api = WeatherAPI(cache=cache)
+    resolved: List[Dict[str, Any]] = []
+    failures: List[Tuple[str, str]] = []
+
+    for _, text in chunk:
+        location = parse_location(text)
+        if 'lat' not in location:
+            coords = api.get_coordinates(location['query'])
+            if coords is None:
+                failures.append((text, api.last_error.message if api.last_error else "Ville introuvable"))
+                continue
+            location.update(name=format_place(coords), lat=coords['lat'], lon=coords['lon'])
+        resolved.append(location)
+
+    api.last_error = None
+    forecasts = api.get_weather_data_batch(
+        [(location['lat'], location['lon']) for location in resolved], days, units
+    )
+
+    rows: List[Dict[str, Any]] = []
+    for location, data in zip(resolved, forecasts):
+        if not data:
+            failures.append((location['query'], api.last_error.message if api.last_error else "Prévisions indisponibles"))
+            continue
+        df, _ = WeatherAnalyzer.analyze_daily_data(data['daily'])
+        df['Date'] = df['Date'].dt.strftime('%Y-%m-%d')
+        for record in df.to_dict('records'):
+            date = record.pop('Date')
+            rows.append(convert_numpy({
+                'location': location['name'],
+                'latitude': location['lat'],
+                'longitude': location['lon'],
+                'date': date,
+                **record
+            }))
+    return rows, failures
+
+
+class AppendWriter:
+    """Sortie NDJSON ou CSV en ajout, tronquée au dernier lot validé à la reprise"""
+
+    def __init__(self, path: str, fmt: str, size: int = 0):
+        """
+        Args:
+            path: Fichier de sortie
+            fmt: 'ndjson' ou 'csv'
+            size: Taille validée par le point de reprise (0 : nouveau fichier)
+        """
+        self.fmt = fmt
+        # Les lignes d'un lot interrompu (écrites après le point de reprise) sont retirées
+        with open(path, 'ab') as handle:
+            handle.truncate(size)
+        self._handle = open(path, 'a', encoding='utf-8', newline='')
+        self._csv = csv.DictWriter(self._handle, fieldnames=FIELDS) if fmt == 'csv' else None
+        if self._csv is not None and size == 0:
+            self._csv.writeheader()
+
+    def write(self, chunk_id: int, rows: List[Dict[str, Any]]) -> None:
+        """Écrire les lignes d'un lot"""
+        if self._csv is not None:
+            self._csv.writerows(rows)
+        else:
+            self._handle.writelines(json.dumps(row, ensure_ascii=False) + '\n' for row in rows)
+
+    def commit(self) -> int:
+        """
+        Rendre les lignes écrites durables
+
+        Returns:
+            Taille du fichier à enregistrer dans le point de reprise
+        """
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        return os.fstat(self._handle.fileno()).st_size
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class ParquetPartWriter:
+    """Sortie Parquet : un fichier par lot dans un dossier (écriture atomique)"""
+
+    def __init__(self, directory: str, fmt: str = 'parquet', size: int = 0):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        if size == 0:
+            # Nouveau départ : les fichiers d'une exécution précédente sont retirés
+            for part in glob.glob(os.path.join(directory, 'part-*.parquet')):
+                os.remove(part)
+
+    def write(self, chunk_id: int, rows: List[Dict[str, Any]]) -> None:
+        """Écrire les lignes d'un lot dans son propre fichier"""
+        import pandas as pd
+
+        target = os.path.join(self.directory, f"part-{chunk_id:06d}.parquet")
+        tmp_target = f"{target}.{os.getpid()}.tmp"
+        pd.DataFrame(rows, columns=FIELDS).to_parquet(tmp_target, index=False)
+        os.replace(tmp_target, target)
+
+    def commit(self) -> int:
+        """Chaque fichier est complet dès son remplacement atomique"""
+        return 1
+
+    def close(self) -> None:
+        pass
+
+
+class Checkpoint:
+    """Point de reprise : lots terminés et tailles validées des sorties"""
+
+    def __init__(self, path: str, signature: Dict[str, Any]):
+        self.path = path
+        self.signature = signature
+        self.done: set = set()
+        self.output_size = 0
+        self.failed_size = 0
+        self.rows = 0
+        self.failures = 0
+
+    @classmethod
+    def load(cls, path: str, signature: Dict[str, Any]) -> "Checkpoint":
+        """
+        Relire le point de reprise d'une exécution précédente
+
+        Args:
+            path: Fichier JSON du point de reprise
+            signature: Paramètres de l'exécution (entrée, format, lots...)
+
+        Returns:
+            Point de reprise (vide si absent)
+
+        Raises:
+            ValueError: Si le point de reprise concerne une autre exécution
+        """
+        checkpoint = cls(path, signature)
+        if not os.path.exists(path):
+            return checkpoint
+        with open(path, encoding='utf-8') as handle:
+            state = json.load(handle)
+        if state.get('signature') != signature:
+            raise ValueError(
+                f"Le point de reprise {path} correspond à une autre exécution "
+                f"(entrée ou options modifiées) : utilisez --restart."
+            )
+        checkpoint.done = set(state['done'])
+        checkpoint.output_size = state['output_size']
+        checkpoint.failed_size = state['failed_size']
+        checkpoint.rows = state['rows']
+        checkpoint.failures = state['failures']
+        return checkpoint
+
+    def save(self) -> None:
+        """Enregistrer le point de reprise (remplacement atomique)"""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as handle:
+            json.dump({
+                'signature': self.signature,
+                'done': sorted(self.done),
+                'output_size': self.output_size,
+                'failed_size': self.failed_size,
+                'rows': self.rows,
+                'failures': self.failures
+            }, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, self.path)
+
+
+def run(
+    input_path: str,
+    output: str,
+    fmt: str,
+    days: int = 7,
+    units: str = "metric",
+    workers: int = FETCH_MAX_WORKERS,
+    batch_size: int = BATCH_MAX_LOCATIONS,
+    checkpoint_path: Optional[str] = None,
+    restart: bool = False
+) -> Dict[str, int]:
+    """
+    Exporter les prévisions de toutes les positions d'un fichier
+
+    Args:
+        input_path: Fichier des positions
+        output: Fichier (NDJSON/CSV) ou dossier (Parquet) de sortie
+        fmt: Format de sortie ('ndjson', 'csv' ou 'parquet')
+        days: Nombre de jours de prévisions (1-16)
+        units: Système d'unités ("metric" ou "imperial")
+        workers: Lots récupérés simultanément
+        batch_size: Positions par lot (une requête multi-coordonnées)
+        checkpoint_path: Point de reprise (défaut : <sortie>.checkpoint.json)
+        restart: Ignorer le point de reprise existant
+
+    Returns:
+        Compteurs {chunks, rows, failures}
+    """
+    checkpoint_path = checkpoint_path or f"{output.rstrip(os.sep)}.checkpoint.json"
+    failed_path = f"{output.rstrip(os.sep)}.failed.txt"
+    stat = os.stat(input_path)
+    signature = {
+        'input': os.path.abspath(input_path),
+        'input_size': stat.st_size,
+        'input_mtime': stat.st_mtime,
+        'format': fmt,
+        'days': days,
+        'units': units,
+        'batch_size': batch_size
+    }
+    if restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    checkpoint = Checkpoint.load(checkpoint_path, signature)
+
+    writer_class = ParquetPartWriter if fmt == 'parquet' else AppendWriter
+    writer = writer_class(output, fmt, checkpoint.output_size)
+    with open(failed_path, 'ab') as handle:
+        handle.truncate(checkpoint.failed_size)
+    failed = open(failed_path, 'a', encoding='utf-8')
+
+    # Cache borné : quelques lots en mémoire au plus, sans toucher au cache de l'application
+    cache = MemoryCache(max_entries=max(batch_size * workers, 1))
+    started = time.time()
+    completed = 0
+
+    def commit(chunk_id: int, rows: List[Dict[str, Any]], failures: List[Tuple[str, str]]) -> None:
+        nonlocal completed
+        writer.write(chunk_id, rows)
+        failed.writelines(f"{text}  # {message}\n" for text, message in failures)
+        failed.flush()
+        os.fsync(failed.fileno())
+        checkpoint.output_size = writer.commit()
+        checkpoint.failed_size = os.fstat(failed.fileno()).st_size
+        checkpoint.done.add(chunk_id)
+        checkpoint.rows += len(rows)
+        checkpoint.failures += len(failures)
+        checkpoint.save()
+        completed += 1
+        print(
+            f"\rLots: {len(checkpoint.done)}  Lignes: {checkpoint.rows}  "
+            f"Échecs: {checkpoint.failures}  ({time.time() - started:.1f} s)",
+            end='', file=sys.stderr, flush=True
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='forecast-cli') as pool:
+            pending: Dict[Any, int] = {}
+            for chunk_id, chunk in enumerate(read_chunks(input_path, batch_size)):
+                if chunk_id in checkpoint.done:
+                    continue
+                pending[pool.submit(process_chunk, chunk, days, units, cache)] = chunk_id
+                # Fenêtre bornée : la lecture attend que des lots se terminent
+                while len(pending) >= workers * 2:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        commit(pending.pop(future), *future.result())
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    commit(pending.pop(future), *future.result())
+    finally:
+        writer.close()
+        failed.close()
+        if completed:
+            print(file=sys.stderr)
+
+    return {'chunks': len(checkpoint.done), 'rows': checkpoint.rows, 'failures': checkpoint.failures}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Export en lot des prévisions météo (NDJSON, CSV ou Parquet)")
+    parser.add_argument('input', help="Fichier des positions (une ville ou 'lat,lon[,libellé]' par ligne)")
+    parser.add_argument('-o', '--output', required=True, help="Fichier de sortie (dossier en Parquet)")
+    parser.add_argument('--format', choices=FORMATS, help="Format de sortie (défaut : extension de la sortie)")
+    parser.add_argument('--days', type=int, default=7, choices=range(1, 17), metavar='1-16', help="Jours de prévisions")
+    parser.add_argument('--units', choices=['metric', 'imperial'], default='metric')
+    parser.add_argument('--workers', type=int, default=FETCH_MAX_WORKERS, help="Lots récupérés simultanément")
+    parser.add_argument('--batch-size', type=int, default=BATCH_MAX_LOCATIONS, help="Positions par requête")
+    parser.add_argument('--checkpoint', help="Point de reprise (défaut : <sortie>.checkpoint.json)")
+    parser.add_argument('--restart', action='store_true', help="Ignorer le point de reprise et tout recommencer")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or os.path.splitext(args.output.rstrip(os.sep))[1].lstrip('.').lower()
+    if fmt == 'jsonl':
+        fmt = 'ndjson'
+    if fmt not in FORMATS:
+        parser.error("format de sortie inconnu : précisez --format ndjson, csv ou parquet")
+    if fmt == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        parser.error("l'export Parquet nécessite pyarrow : pip install pyarrow")
+    if args.workers < 1 or not 1 <= args.batch_size <= BATCH_MAX_LOCATIONS:
+        parser.error(f"--workers doit être positif et --batch-size compris entre 1 et {BATCH_MAX_LOCATIONS}")
+
+    try:
+        summary = run(
+            args.input, args.output, fmt, args.days, args.units,
+            args.workers, args.batch_size, args.checkpoint, args.restart
+        )
+    except (OSError, ValueError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 2
+
+    print(
+        f"{summary['rows']} lignes écrites dans {args.output} "
+        f"({summary['chunks']} lots, {summary['failures']} positions en échec)"
+    )
+    return 1 if summary['failures'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""
+Modèle colonnaire des prévisions météo (ForecastFrame)
+
+La réponse JSON d'Open-Meteo est analysée une seule fois : chaque série
+devient un tableau NumPy typé (float32 pour les mesures, int16 pour les
+codes et pourcentages, datetime64 pour les horodatages). Les blocs se
+lisent comme des dictionnaires (`frame['hourly']['temperature_2m']`) et
+renvoient les tableaux eux-mêmes, sans copie.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+import numpy as np
+
+# Séries d'horodatages ISO 8601 (parsées une fois en datetime64)
+TIME_FIELDS = {'time', 'sunrise', 'sunset'}
+
+# Séries entières stockées en int16 (repli en float32 si des valeurs manquent)
+INT_FIELDS = {
+    'weather_code', 'is_day', 'relative_humidity_2m',
+    'precipitation_probability', 'precipitation_probability_max'
+}
+
+SECTIONS = ('current', 'hourly', 'daily')
+
+
+def _to_column(field: str, values: List[Any]) -> np.ndarray:
+    """
+    Convertir une série JSON en tableau NumPy typé
+
+    Args:
+        field: Nom du champ Open-Meteo
+        values: Valeurs de la série (None pour les valeurs manquantes)
+
+    Returns:
+        Tableau datetime64, int16 ou float32 (NaN pour les manquants)
+    """
+    if field in TIME_FIELDS:
+        # Unité déduite du format : jour pour les dates, minute pour les heures
+        return np.array(values, dtype='datetime64')
+    if field in INT_FIELDS and None not in values:
+        return np.array(values, dtype=np.int16)
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float32)
+
+
+def _to_json_values(column: np.ndarray) -> List[Any]:
+    """
+    Reconvertir un tableau en série JSON (inverse de _to_column)
+
+    Args:
+        column: Tableau typé
+
+    Returns:
+        Liste de valeurs natives (None pour NaN, flottants au plus court)
+    """
+    if np.issubdtype(column.dtype, np.datetime64):
+        return np.datetime_as_string(column).tolist()
+    if np.issubdtype(column.dtype, np.integer):
+        return column.tolist()
+    # str() d'un float32 donne sa représentation la plus courte (21.3 et non 21.2999…)
+    return [None if np.isnan(v) else float(str(v)) for v in column]
+
+
+class ForecastBlock:
+    """Section de prévisions (horaire ou quotidienne) au format colonnaire"""
+
+    __slots__ = ('columns', 'units')
+
+    def __init__(self, columns: Dict[str, np.ndarray], units: Optional[Dict[str, str]] = None):
+        self.columns = columns
+        self.units = units or {}
+
+    @classmethod
+    def from_json(cls, section: Dict[str, List[Any]], units: Optional[Dict[str, str]] = None) -> "ForecastBlock":
+        """
+        Construire un bloc depuis une section de la réponse API
+
+        Args:
+            section: Dictionnaire {champ: liste de valeurs}
+            units: Unités des champs
+
+        Returns:
+            Bloc colonnaire
+        """
+        return cls({field: _to_column(field, values) for field, values in section.items()}, units)
+
+    @property
+    def time(self) -> np.ndarray:
+        """Horodatages du bloc (datetime64)"""
+        return self.columns['time']
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+
+    def __contains__(self, field: object) -> bool:
+        return field in self.columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        """Nombre de pas de temps"""
+        time = self.columns.get('time')
+        return 0 if time is None else len(time)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """Lire une colonne, ou la valeur par défaut si elle est absente"""
+        return self.columns.get(field, default)
+
+    def keys(self):
+        """Noms des colonnes"""
+        return self.columns.keys()
+
+    def locate(self, timestamp: Any) -> int:
+        """
+        Trouver par recherche dichotomique le pas de temps contenant un instant
+
+        Args:
+            timestamp: Instant (datetime64 ou chaîne ISO 8601)
+
+        Returns:
+            Indice du dernier pas commençant avant ou à cet instant (borné au bloc)
+        """
+        index = int(np.searchsorted(self.time, np.datetime64(timestamp), side='right')) - 1
+        return min(max(index, 0), max(len(self) - 1, 0))
+
+    def window(self, start: int, length: int) -> "ForecastBlock":
+        """
+        Fenêtre de pas de temps consécutifs, sans copie
+
+        Args:
+            start: Indice du premier pas
+            length: Nombre de pas (tronqué à la fin du bloc)
+
+        Returns:
+            Bloc dont les colonnes sont des vues sur celles de ce bloc
+        """
+        bounds = slice(start, start + length)
+        return ForecastBlock({field: column[bounds] for field, column in self.columns.items()}, self.units)
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        Reconstruire la section au format JSON de l'API
+
+        Returns:
+            Dictionnaire {champ: liste de valeurs natives}
+        """
+        return {field: _to_json_values(column) for field, column in self.columns.items()}
+
+
+class ForecastFrame:
+    """Prévisions complètes d'un lieu : conditions actuelles + blocs colonnaires"""
+
+    __slots__ = ('current', 'current_units', 'hourly', 'daily', 'meta', '_windows')
+
+    def __init__(
+        self,
+        current: Dict[str, Any],
+        hourly: Optional[ForecastBlock],
+        daily: Optional[ForecastBlock],
+        current_units: Optional[Dict[str, str]] = None,
+        meta: Optional[Dict[str, Any]] = None
+    ):
+        self.current = current
+        self.current_units = current_units or {}
+        self.hourly = hourly
+        self.daily = daily
+        self.meta = meta or {}
+        self._windows: Dict[tuple, ForecastBlock] = {}
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "ForecastFrame":
+        """
+        Analyser une réponse Open-Meteo (une seule fois par récupération)
+
+        Args:
+            data: Données météo JSON (voir WeatherAPI.get_weather_data)
+
+        Returns:
+            ForecastFrame typé
+        """
+        blocks = {
+            section: ForecastBlock.from_json(data[section], data.get(f'{section}_units'))
+            if section in data else None
+            for section in ('hourly', 'daily')
+        }
+        meta = {
+            key: value for key, value in data.items()
+            if key not in SECTIONS and not key.endswith('_units')
+        }
+        return cls(
+            dict(data.get('current', {})),
+            blocks['hourly'],
+            blocks['daily'],
+            data.get('current_units'),
+            meta
+        )
+
+    def current_hour_index(self) -> int:
+        """
+        Indice de l'heure courante dans le bloc horaire
+
+        Returns:
+            Indice de l'échéance contenant `current['time']` (0 si inconnue)
+        """
+        now = self.current.get('time')
+        if self.hourly is None or not now:
+            return 0
+        return self.hourly.locate(now)
+
+    def hourly_window(self, hours: int = 24, offset: int = 0) -> ForecastBlock:
+        """
+        Fenêtre glissante des prochaines heures, calculée une fois par frame
+
+        Args:
+            hours: Nombre d'heures (24, 48 ou personnalisé)
+            offset: Décalage en heures par rapport à l'heure courante
+
+        Returns:
+            Bloc horaire partagé par le graphique et le tableau (vues, sans copie)
+        """
+        key = (hours, offset)
+        window = self._windows.get(key)
+        if window is None:
+            start = max(self.current_hour_index() + offset, 0)
+            window = self['hourly'].window(start, hours)
+            self._windows[key] = window
+        return window
+
+    def __getitem__(self, key: str) -> Any:
+        if key in ('current', 'current_units', 'hourly', 'daily'):
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if key in ('hourly_units', 'daily_units'):
+            return self[key[:-len('_units')]].units
+        return self.meta[key]
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Lire une section ou une métadonnée, ou la valeur par défaut"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Reconstruire la réponse au format JSON de l'API
+
+        Returns:
+            Dictionnaire JSON-sérialisable
+        """
+        data = dict(self.meta)
+        data['current'] = dict(self.current)
+        data['current_units'] = dict(self.current_units)
+        for section in ('hourly', 'daily'):
+            block = getattr(self, section)
+            if block is not None:
+                data[section] = block.to_dict()
+                data[f'{section}_units'] = dict(block.units)
+        return data
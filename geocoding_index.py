@@ -0,0 +1,174 @@
+"""
+Index local de géocodage (recherche par préfixe et approximative)
+
+Le dictionnaire géographique fourni (`data/gazetteer.csv`) est chargé une
+seule fois par processus dans une table triée de noms normalisés (sans
+accents ni casse) : une recherche exacte coûte quelques microsecondes et
+une recherche par préfixe une dichotomie. Le géocodage n'utilise que les
+correspondances exactes (l'API distante est appelée pour les lieux absents) ;
+la similarité (fautes de frappe) est réservée aux suggestions de saisie.
+"""
+
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import csv
+import difflib
+import os
+import re
+import unicodedata
+
+from config import GAZETTEER_PATH, GEOCODING_FUZZY_CUTOFF, GEOCODING_SUGGESTION_LIMIT
+
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_name(text: str) -> str:
+    """
+    Normaliser un nom de lieu pour la recherche
+
+    Args:
+        text: Nom saisi (ex: "Fès", "  NEW-YORK ")
+
+    Returns:
+        Clé sans accents, en minuscules, mots séparés par une espace (ex: "fes")
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return _SEPARATORS.sub(' ', stripped.casefold()).strip()
+
+
+def format_place(coords: Dict[str, Any]) -> str:
+    """Libellé d'un lieu, sans ambiguïté pour lookup() (ex: "Valence, Espagne")"""
+    return f"{coords['name']}, {coords['country']}" if coords.get('country') else coords['name']
+
+
+class GeocodingIndex:
+    """Table triée des noms de lieux normalisés"""
+
+    def __init__(self, places: List[Dict[str, Any]], populations: Optional[List[int]] = None):
+        """
+        Args:
+            places: Lieux au format de WeatherAPI.get_coordinates, avec une clé
+                optionnelle 'aliases' (autres noms du lieu)
+            populations: Population de chaque lieu (départage les homonymes)
+        """
+        self.places: List[Dict[str, Any]] = []
+        self.populations = populations or [0] * len(places)
+        # Nom complet normalisé -> lieux (recherche exacte)
+        self._exact: Dict[str, List[int]] = {}
+        # Clés triées (nom complet et chaque fin de nom commençant un mot) pour les préfixes
+        prefix_entries: List[Tuple[str, int]] = []
+
+        for index, place in enumerate(places):
+            place = dict(place)
+            aliases = place.pop('aliases', ())
+            self.places.append(place)
+            for name in {normalize_name(place['name']), *map(normalize_name, aliases)}:
+                if not name:
+                    continue
+                self._exact.setdefault(name, []).append(index)
+                words = name.split(' ')
+                for start in range(len(words)):
+                    prefix_entries.append((' '.join(words[start:]), index))
+
+        prefix_entries.sort()
+        self._keys = [key for key, _ in prefix_entries]
+        self._ids = [index for _, index in prefix_entries]
+        self._names = sorted(self._exact)
+
+    @classmethod
+    def from_csv(cls, path: str) -> "GeocodingIndex":
+        """
+        Charger un dictionnaire géographique CSV
+
+        Args:
+            path: Fichier avec les colonnes name, country, latitude, longitude,
+                timezone, population, alternate_names (séparés par "|")
+
+        Returns:
+            Index prêt à l'emploi (vide si le fichier est absent)
+        """
+        places, populations = [], []
+        if not os.path.exists(path):
+            return cls(places, populations)
+        with open(path, encoding='utf-8', newline='') as handle:
+            for row in csv.DictReader(handle):
+                places.append({
+                    'lat': float(row['latitude']),
+                    'lon': float(row['longitude']),
+                    'name': row['name'],
+                    'country': row['country'],
+                    'timezone': row['timezone'] or 'auto',
+                    'aliases': [alias for alias in row['alternate_names'].split('|') if alias]
+                })
+                populations.append(int(row['population'] or 0))
+        return cls(places, populations)
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def _rank(self, ids: List[int], country: str = '') -> List[int]:
+        """Lieux distincts du plus peuplé au moins peuplé, filtrés par pays"""
+        unique = dict.fromkeys(ids)
+        if country:
+            unique = {
+                index: None for index in unique
+                if normalize_name(self.places[index]['country']).startswith(country)
+            }
+        return sorted(unique, key=lambda index: -self.populations[index])
+
+    @staticmethod
+    def _split_query(query: str) -> Tuple[str, str]:
+        """Séparer "ville, pays" en clés normalisées (pays vide si absent)"""
+        name, _, country = query.rpartition(',') if ',' in query else (query, '', '')
+        return normalize_name(name), normalize_name(country)
+
+    def lookup(self, query: str, fuzzy: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Trouver les coordonnées d'un lieu
+
+        Args:
+            query: Nom du lieu, éventuellement suivi du pays ("Valence, Espagne")
+            fuzzy: Accepter le nom le plus proche en cas de faute de frappe
+
+        Returns:
+            Copie du lieu (lat, lon, name, country, timezone), ou None
+        """
+        name, country = self._split_query(query)
+        ranked = self._rank(self._exact.get(name, []), country)
+        if not ranked and fuzzy and name:
+            for candidate in difflib.get_close_matches(name, self._names, n=3, cutoff=GEOCODING_FUZZY_CUTOFF):
+                ranked = self._rank(self._exact[candidate], country)
+                if ranked:
+                    break
+        return dict(self.places[ranked[0]]) if ranked else None
+
+    def search(self, prefix: str, limit: int = GEOCODING_SUGGESTION_LIMIT) -> List[Dict[str, Any]]:
+        """
+        Suggestions pour une saisie partielle (autocomplétion)
+
+        Args:
+            prefix: Début du nom (ou d'un de ses mots : "york" -> New York)
+            limit: Nombre maximum de suggestions
+
+        Returns:
+            Lieux correspondants, les plus peuplés d'abord ; à défaut de
+            préfixe, les noms les plus proches (fautes de frappe)
+        """
+        name, country = self._split_query(prefix)
+        if not name:
+            return []
+        start = bisect_left(self._keys, name)
+        end = bisect_left(self._keys, name + '\uffff', start)
+        ranked = self._rank(self._ids[start:end], country)
+        if not ranked:
+            close = difflib.get_close_matches(name, self._names, n=limit, cutoff=GEOCODING_FUZZY_CUTOFF - 0.1)
+            ranked = self._rank([index for candidate in close for index in self._exact[candidate]], country)
+        return [dict(self.places[index]) for index in ranked[:limit]]
+
+
+@lru_cache(maxsize=1)
+def get_geocoding_index() -> GeocodingIndex:
+    """Index du dictionnaire géographique fourni (chargé une fois par processus)"""
+    return GeocodingIndex.from_csv(GAZETTEER_PATH)
@@ -0,0 +1,177 @@
+"""
+Pré-chauffage du cache pour les villes prédéfinies
+
+Un thread de fond maintient en cache les prévisions et la qualité de l'air
+de toutes les villes de PREDEFINED_CITIES : chaque jeu de données est
+rafraîchi juste avant son expiration (avec un aléa pour étaler la charge),
+en requêtes multi-coordonnées et sans géocodage (table statique). Une
+position en échec est retentée rapidement (délai croissant plafonné).
+
+Le thread démarre sans bloquer ; seul un rendu demandant une ville
+prédéfinie encore absente du cache attend le premier passage
+(PREWARM_STARTUP_WAIT). Avec le cache SQLite partagé, `python prewarmer.py`
+remplit le cache avant la mise en service (étape de déploiement).
+"""
+
+from typing import Dict, List, Optional, Tuple
+import random
+import threading
+import time
+
+from config import (
+    PREDEFINED_CITIES, PREDEFINED_CITY_COORDS,
+    CACHE_TTL_WEATHER, CACHE_TTL_AIR_QUALITY,
+    PREWARM_ENABLED, PREWARM_FORECAST_DAYS, PREWARM_LEAD_TIME, PREWARM_JITTER,
+    PREWARM_RETRY_DELAY, PREWARM_STARTUP_WAIT
+)
+from weather_api import WeatherAPI
+
+
+class CacheWarmer:
+    """Planificateur des rafraîchissements du cache des villes prédéfinies"""
+
+    def __init__(
+        self,
+        cities: Optional[List[str]] = None,
+        days: int = PREWARM_FORECAST_DAYS,
+        lead_time: float = PREWARM_LEAD_TIME,
+        jitter: float = PREWARM_JITTER,
+        retry_delay: float = PREWARM_RETRY_DELAY,
+        api: Optional[WeatherAPI] = None
+    ):
+        cities = cities if cities is not None else PREDEFINED_CITIES
+        self.locations: List[Tuple[float, float]] = [
+            (PREDEFINED_CITY_COORDS[city]['lat'], PREDEFINED_CITY_COORDS[city]['lon'])
+            for city in cities if city in PREDEFINED_CITY_COORDS
+        ]
+        self.days = days
+        self.lead_time = lead_time
+        self.jitter = jitter
+        self.retry_delay = retry_delay
+        self.api = api if api is not None else WeatherAPI()
+        # Jeu de données -> (durée de vie, prochaine échéance par position)
+        self.schedule: Dict[str, Tuple[float, Dict[Tuple[float, float], float]]] = {
+            'weather': (CACHE_TTL_WEATHER, {}),
+            'air_quality': (CACHE_TTL_AIR_QUALITY, {})
+        }
+        # (jeu de données, position) -> échecs consécutifs
+        self.failures: Dict[Tuple[str, Tuple[float, float]], int] = {}
+        self.refresh_count = 0
+        self._first_pass = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _next_due(self, ttl: float) -> float:
+        """Prochaine échéance : juste avant l'expiration, moins un aléa"""
+        return time.time() + max(ttl - self.lead_time - random.uniform(0, self.jitter), 1.0)
+
+    def _retry_due(self, failures: int) -> float:
+        """Échéance d'un nouvel essai après `failures` échecs consécutifs"""
+        return time.time() + min(self.retry_delay * 2 ** (failures - 1), self.lead_time)
+
+    def warm_due(self) -> float:
+        """
+        Rafraîchir les positions arrivées à échéance
+
+        Returns:
+            Délai en secondes avant la prochaine échéance
+        """
+        now = time.time()
+        for dataset, (ttl, due) in self.schedule.items():
+            # Les positions proches de l'échéance partent avec le lot : une requête par tour
+            pending = [loc for loc in self.locations if due.get(loc, 0) <= now + self.jitter]
+            if not pending:
+                continue
+            refreshed = set(self.api.warm_locations(
+                pending, self.days, air_quality=(dataset == 'air_quality')
+            ))
+            self.refresh_count += len(refreshed)
+            for loc in pending:
+                if loc in refreshed:
+                    self.failures.pop((dataset, loc), None)
+                    due[loc] = self._next_due(ttl)
+                else:
+                    # Échec : nouvel essai rapproché, le cache garde l'ancienne donnée entre-temps
+                    failures = self.failures.get((dataset, loc), 0) + 1
+                    self.failures[(dataset, loc)] = failures
+                    due[loc] = self._retry_due(failures)
+
+        upcoming = [t for _, due in self.schedule.values() for t in due.values()]
+        return max(min(upcoming) - time.time(), 0.0) if upcoming else 0.0
+
+    def run(self) -> None:
+        """Boucle du thread de fond (jusqu'à stop())"""
+        while not self._stop.is_set():
+            try:
+                delay = self.warm_due()
+            except Exception:
+                # Erreur inattendue : nouvel essai plus tard plutôt que l'arrêt du thread
+                delay = self.lead_time
+            finally:
+                self._first_pass.set()
+            self._stop.wait(delay)
+
+    def wait_for_city(self, city: str, timeout: float = PREWARM_STARTUP_WAIT) -> bool:
+        """
+        Attendre le premier passage si une ville prédéfinie manque au cache
+
+        Args:
+            city: Nom de la ville demandée
+            timeout: Attente maximale en secondes
+
+        Returns:
+            True si la ville n'a pas à attendre (autre ville, cache chaud, premier passage terminé)
+        """
+        coords = PREDEFINED_CITY_COORDS.get(city)
+        if coords is None or self._first_pass.is_set():
+            return True
+        keys = (
+            self.api._weather_cache_key(coords['lat'], coords['lon']),
+            self.api._air_quality_cache_key(coords['lat'], coords['lon'])
+        )
+        if all(self.api.cache.get(key) is not None for key in keys):
+            return True
+        return self._first_pass.wait(timeout)
+
+    def start(self) -> None:
+        """Démarrer le thread de fond (sans effet s'il tourne déjà)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name='cache-warmer', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Arrêter le thread de fond"""
+        self._stop.set()
+
+
+_WARMER: Optional[CacheWarmer] = None
+_WARMER_LOCK = threading.Lock()
+
+
+def ensure_prewarmer_started() -> Optional[CacheWarmer]:
+    """
+    Démarrer le pré-chauffage une seule fois par processus (sans attendre)
+
+    Returns:
+        Planificateur actif, ou None si désactivé (METEO_PREWARM=0)
+    """
+    global _WARMER
+    if not PREWARM_ENABLED:
+        return None
+    if _WARMER is None:
+        with _WARMER_LOCK:
+            if _WARMER is None:
+                warmer = CacheWarmer()
+                warmer.start()
+                _WARMER = warmer
+    return _WARMER
+
+
+if __name__ == "__main__":
+    # Étape de déploiement : un passage complet dans le cache partagé (SQLite)
+    warmer = CacheWarmer()
+    warmer.warm_due()
+    print(f"{warmer.refresh_count} jeux de données mis en cache, {len(warmer.failures)} en échec")
+    raise SystemExit(1 if warmer.failures else 0)
@@ -0,0 +1,221 @@
+"""
+Limitation du débit des appels amont (par endpoint Open-Meteo)
+
+Chaque hôte (prévisions, géocodage, qualité de l'air) dispose d'un seau à
+jetons et d'un sémaphore de requêtes simultanées, partagés par tous les
+threads du processus. Une réponse 429 suspend l'endpoint pendant la durée
+indiquée par `Retry-After` pour tous les appelants.
+"""
+
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+import threading
+import time
+
+from config import RATE_LIMITS, RATE_LIMIT_DEFAULT, RATE_LIMIT_MAX_WAIT
+
+
+class RateLimitExceeded(Exception):
+    """Attente nécessaire supérieure au maximum autorisé"""
+
+    def __init__(self, endpoint: str, wait: float):
+        super().__init__(f"{endpoint} : limite de débit atteinte, réessayer dans {wait:.0f} s")
+        self.endpoint = endpoint
+        self.wait = wait
+
+
+class TokenBucket:
+    """Seau à jetons thread-safe (débit moyen + rafale)"""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Jetons ajoutés par seconde
+            burst: Capacité du seau (requêtes possibles d'un coup)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Réserver un jeton (le solde peut devenir négatif : file d'attente)
+
+        Returns:
+            Délai en secondes avant de pouvoir utiliser le jeton
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refund(self) -> None:
+        """Rendre un jeton réservé mais inutilisé"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+
+class EndpointLimiter:
+    """Gouverneur d'un endpoint : débit, requêtes simultanées et pause Retry-After"""
+
+    def __init__(self, name: str, rate: float, burst: int, max_in_flight: int):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst)
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self.max_in_flight = max_in_flight
+        self.requests = 0
+        self.throttled = 0
+        self.throttle_time = 0.0
+        self.retry_after_count = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.in_flight = 0
+
+    def pause(self, delay: float) -> None:
+        """
+        Suspendre l'endpoint pour tous les threads (réponse 429)
+
+        Args:
+            delay: Durée de la pause en secondes (ex: en-tête Retry-After)
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self.retry_after_count += 1
+
+    @contextmanager
+    def acquire(self, max_wait: float = RATE_LIMIT_MAX_WAIT) -> Iterator[None]:
+        """
+        Attendre un jeton et une place libre, puis exécuter le bloc
+
+        Args:
+            max_wait: Attente maximale acceptée en secondes
+
+        Raises:
+            RateLimitExceeded: Si l'attente dépasserait max_wait
+        """
+        with self._lock:
+            pause = max(self._paused_until - time.monotonic(), 0.0)
+        if pause > max_wait:
+            raise RateLimitExceeded(self.name, pause)
+        delay = self.bucket.reserve()
+        wait = max(delay, pause)
+        if wait > max_wait:
+            self.bucket.refund()
+            raise RateLimitExceeded(self.name, wait)
+
+        started = time.monotonic()
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+        try:
+            if wait > 0:
+                time.sleep(wait)
+            # Temps restant pour obtenir une place parmi les requêtes en cours
+            remaining = max(max_wait - (time.monotonic() - started), 0.0)
+            if not self._slots.acquire(timeout=remaining):
+                raise RateLimitExceeded(self.name, max_wait)
+        finally:
+            waited = time.monotonic() - started
+            with self._lock:
+                self.queued -= 1
+                self.requests += 1
+                if waited > 0.001:
+                    self.throttled += 1
+                    self.throttle_time += waited
+
+        with self._lock:
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Métriques de l'endpoint
+
+        Returns:
+            Dictionnaire {requests, throttled, throttle_time, queued,
+            max_queued, in_flight, retry_after_count, paused_for}
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'throttle_time': round(self.throttle_time, 3),
+                'queued': self.queued,
+                'max_queued': self.max_queued,
+                'in_flight': self.in_flight,
+                'retry_after_count': self.retry_after_count,
+                'paused_for': round(max(self._paused_until - time.monotonic(), 0.0), 3)
+            }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Lire l'en-tête Retry-After (secondes ou date HTTP)
+
+    Args:
+        value: Valeur brute de l'en-tête
+
+    Returns:
+        Délai en secondes, ou None si absent ou illisible
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+# Gouverneurs partagés par hôte (un par processus)
+_LIMITERS: Dict[str, EndpointLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(url: str) -> EndpointLimiter:
+    """
+    Obtenir le gouverneur partagé de l'endpoint d'une URL
+
+    Args:
+        url: URL de l'API
+
+    Returns:
+        Gouverneur configuré par RATE_LIMITS (RATE_LIMIT_DEFAULT sinon)
+    """
+    host = urlparse(url).hostname or ''
+    limiter = _LIMITERS.get(host)
+    if limiter is not None:
+        return limiter
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            rate, burst, max_in_flight = RATE_LIMITS.get(host, RATE_LIMIT_DEFAULT)
+            limiter = EndpointLimiter(host, rate, burst, max_in_flight)
+            _LIMITERS[host] = limiter
+    return limiter
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Métriques de tous les endpoints sollicités
+
+    Returns:
+        Dictionnaire {hôte: métriques}
+    """
+    return {host: limiter.stats() for host, limiter in list(_LIMITERS.items())}
+
@@ -0,0 +1,295 @@
+"""
+Résilience des appels amont : délais avec aléa, disjoncteur, budget de retry
+
+- Délai exponentiel à aléa complet (« full jitter ») entre deux tentatives,
+  pour que les clients ne retentent pas tous au même instant.
+- Disjoncteur par endpoint : après plusieurs échecs consécutifs, les appels
+  échouent immédiatement (le cache sert les données existantes) jusqu'à un
+  essai de rétablissement.
+- Budget de retry global : les nouvelles tentatives sont limitées à une
+  fraction du trafic, pour ne pas amplifier la charge pendant un incident.
+
+Les changements d'état du disjoncteur sont journalisés (logging), conservés
+dans un historique et transmis aux observateurs enregistrés.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+import random
+import threading
+import time
+
+from config import (
+    RETRY_MAX_DELAY, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RECOVERY_TIMEOUT,
+    RETRY_BUDGET_RATIO, RETRY_BUDGET_MIN_PER_SECOND
+)
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def backoff_delay(
+    attempt: int,
+    base: float,
+    cap: float = RETRY_MAX_DELAY,
+    retry_after: Optional[float] = None
+) -> float:
+    """
+    Délai avant une nouvelle tentative (exponentiel, aléa complet)
+
+    Args:
+        attempt: Numéro de la tentative échouée (0 pour la première)
+        base: Délai de base en secondes
+        cap: Plafond du délai exponentiel
+        retry_after: Délai imposé par le serveur, prioritaire s'il est connu
+
+    Returns:
+        Délai en secondes, tiré uniformément dans [0, min(cap, base × 2^attempt)]
+    """
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Disjoncteur thread-safe d'un endpoint (fermé -> ouvert -> semi-ouvert)"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_RECOVERY_TIMEOUT
+    ):
+        """
+        Args:
+            name: Nom de l'endpoint (hôte)
+            failure_threshold: Échecs consécutifs avant ouverture
+            recovery_timeout: Durée d'ouverture avant un essai de rétablissement (s)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.rejected = 0
+        self.history: Deque[Tuple[float, str, str]] = deque(maxlen=50)
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._listeners: List[Callable[[str, str, str], None]] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, callback: Callable[[str, str, str], None]) -> None:
+        """
+        Enregistrer un observateur des changements d'état
+
+        Args:
+            callback: Fonction appelée avec (endpoint, ancien état, nouvel état)
+        """
+        self._listeners.append(callback)
+
+    def _transition(self, state: str) -> Optional[Tuple[str, str]]:
+        """Changer d'état (verrou tenu) ; renvoie la transition à notifier"""
+        if state == self.state:
+            return None
+        previous, self.state = self.state, state
+        self.history.append((time.time(), previous, state))
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        if state != HALF_OPEN:
+            self._probe_started = None
+        return previous, state
+
+    def _notify(self, transition: Optional[Tuple[str, str]]) -> None:
+        """Journaliser et notifier une transition (hors verrou)"""
+        if transition is None:
+            return
+        previous, state = transition
+        logger.warning("Disjoncteur %s : %s -> %s", self.name, previous, state)
+        for callback in list(self._listeners):
+            try:
+                callback(self.name, previous, state)
+            except Exception:
+                pass
+
+    def retry_in(self) -> float:
+        """Secondes restantes avant l'essai de rétablissement (0 si fermé)"""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(self.recovery_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+    def allow(self) -> bool:
+        """
+        Autoriser (ou non) un appel vers l'endpoint
+
+        Returns:
+            True si le circuit est fermé, ou pour l'unique appel d'essai
+            une fois le délai de rétablissement écoulé
+        """
+        transition = None
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN and now - self._opened_at >= self.recovery_timeout:
+                transition = self._transition(HALF_OPEN)
+            if self.state == CLOSED:
+                allowed = True
+            elif self.state == HALF_OPEN and (
+                self._probe_started is None or now - self._probe_started >= self.recovery_timeout
+            ):
+                # Un seul appel d'essai à la fois (renouvelé s'il n'a jamais conclu)
+                self._probe_started = now
+                allowed = True
+            else:
+                self.rejected += 1
+                allowed = False
+        self._notify(transition)
+        return allowed
+
+    def record_success(self) -> None:
+        """Signaler un appel réussi (referme le circuit)"""
+        with self._lock:
+            self.consecutive_failures = 0
+            transition = self._transition(CLOSED)
+        self._notify(transition)
+
+    def record_failure(self) -> None:
+        """Signaler un échec (timeout, connexion, 5xx)"""
+        transition = None
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                transition = self._transition(OPEN)
+        self._notify(transition)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        État du disjoncteur
+
+        Returns:
+            Dictionnaire {state, consecutive_failures, rejected, transitions}
+        """
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'rejected': self.rejected,
+                'transitions': list(self.history)
+            }
+
+
+class RetryBudget:
+    """Budget de nouvelles tentatives partagé (fraction du trafic + plancher)"""
+
+    def __init__(
+        self,
+        ratio: float = RETRY_BUDGET_RATIO,
+        min_per_second: float = RETRY_BUDGET_MIN_PER_SECOND,
+        capacity: float = 10.0
+    ):
+        """
+        Args:
+            ratio: Nouvelles tentatives gagnées par requête (0.2 = 20 % du trafic)
+            min_per_second: Nouvelles tentatives toujours permises à faible trafic
+            capacity: Solde maximal accumulable
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.retries = 0
+        self.exhausted = 0
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def record_request(self) -> None:
+        """Créditer le budget pour une nouvelle requête (hors retry)"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        Consommer une nouvelle tentative
+
+        Returns:
+            True si le budget le permet, False s'il est épuisé
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.retries += 1
+                return True
+            self.exhausted += 1
+            return False
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Compteurs du budget
+
+        Returns:
+            Dictionnaire {available, retries, exhausted}
+        """
+        with self._lock:
+            self._refill()
+            return {
+                'available': round(self._tokens, 2),
+                'retries': self.retries,
+                'exhausted': self.exhausted
+            }
+
+
+# Disjoncteurs par hôte et budget global (un par processus)
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+_RETRY_BUDGET = RetryBudget()
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """
+    Obtenir le disjoncteur partagé de l'endpoint d'une URL
+
+    Args:
+        url: URL de l'API
+
+    Returns:
+        Disjoncteur de l'hôte
+    """
+    host = urlparse(url).hostname or ''
+    breaker = _BREAKERS.get(host)
+    if breaker is not None:
+        return breaker
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host)
+            _BREAKERS[host] = breaker
+    return breaker
+
+
+def get_retry_budget() -> RetryBudget:
+    """Budget de retry partagé par tout le processus"""
+    return _RETRY_BUDGET
+
+
+def get_resilience_stats() -> Dict[str, Any]:
+    """
+    État des disjoncteurs et du budget de retry
+
+    Returns:
+        Dictionnaire {circuits: {hôte: état}, retry_budget: compteurs}
+    """
+    return {
+        'circuits': {host: breaker.stats() for host, breaker in list(_BREAKERS.items())},
+        'retry_budget': _RETRY_BUDGET.stats()
+    }
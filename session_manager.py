@@ -3,7 +3,9 @@ Gestion de la session Streamlit pour les favoris, historique et préférences
 """
 
 import streamlit as st
-from typing import List, Dict, Any
+import hashlib
+import json
+from typing import Any, Callable, Dict, Hashable, List, Optional
 
 
 class SessionManager:
@@ -19,7 +21,9 @@ class SessionManager:
             'current_units': 'metric',
             'theme': 'dark',
             'comparison_cities': [],
-            'alerts_enabled': True
+            'alerts_enabled': True,
+            'data_version': None,
+            '_memo': {}
         }
         
         for key, value in defaults.items():
@@ -84,3 +88,61 @@ class SessionManager:
             st.session_state.comparison_cities = []
         
         return st.session_state.comparison_cities
+    
+    @staticmethod
+    def set_weather_data(
+        weather_data: Dict[str, Any],
+        aqi_data: Dict[str, Any],
+        city_info: Dict[str, Any],
+        units: str
+    ):
+        """
+        Enregistrer les données récupérées et calculer leur version
+        
+        Args:
+            weather_data: Données météo (métriques)
+            aqi_data: Données de qualité de l'air
+            city_info: Informations sur la ville
+            units: Système d'unités affiché
+        """
+        st.session_state.weather_data = weather_data
+        st.session_state.aqi_data = aqi_data
+        st.session_state.city_info = city_info
+        st.session_state.current_units = units
+        
+        # Version = empreinte du contenu : identique tant que les données ne changent pas
+        payload = json.dumps([weather_data, aqi_data, city_info], sort_keys=True, default=str)
+        st.session_state.data_version = hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+        st.session_state['_memo'] = {}
+    
+    @staticmethod
+    def get_data_version() -> Optional[str]:
+        """
+        Obtenir la version des données affichées
+        
+        Returns:
+            Empreinte des données courantes ou None
+        """
+        return st.session_state.get('data_version')
+    
+    @staticmethod
+    def memoize(name: str, version: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Mémoïser un résultat calculé pour une version donnée des données
+        
+        Args:
+            name: Nom du résultat
+            version: Clé de version (ex: version des données, unités)
+            factory: Fonction qui calcule le résultat
+            
+        Returns:
+            Résultat mémoïsé, recalculé uniquement si la version change
+        """
+        memo = st.session_state.setdefault('_memo', {})
+        entry = memo.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        
+        value = factory()
+        memo[name] = (version, value)
+        return value
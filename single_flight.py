@@ -0,0 +1,86 @@
+"""
+Regroupement des appels identiques simultanés (single-flight)
+
+Tant qu'un appel est en cours pour une clé, les appels suivants avec la
+même clé attendent son résultat au lieu de relancer le travail.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional
+import threading
+
+
+class _Call:
+    """Appel en cours partagé par un meneur et ses suiveurs"""
+
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Groupe d'appels thread-safe dédoublonnés par clé"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Exécuter `func` une seule fois pour tous les appelants simultanés de `key`
+
+        Args:
+            key: Clé identifiant l'appel (ex: endpoint + paramètres)
+            func: Fonction sans argument à exécuter
+
+        Returns:
+            Résultat de l'appel partagé (l'exception éventuelle est relancée
+            chez chaque appelant)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = func()
+            except BaseException as e:
+                call.error = e
+            finally:
+                # Retirer la clé avant de réveiller : un appel ultérieur repart à neuf
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Compteurs du groupe
+
+        Returns:
+            Dictionnaire {executed, coalesced, in_flight}
+        """
+        with self._lock:
+            return {
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls)
+            }
@@ -0,0 +1,78 @@
+"""
+Adaptateur Streamlit de la couche d'accès aux données
+
+WeatherAPI ne dépend pas de Streamlit : elle signale ses erreurs sous forme
+d'ApiError. Cet adaptateur les collecte (depuis n'importe quel thread,
+y compris ceux de fetch_engine) et les affiche dans la page depuis le
+thread du script, une seule fois par message. Chaque instance a son propre
+collecteur : une requête partagée (single-flight) entre plusieurs sessions
+signale son erreur à chacune d'elles.
+"""
+
+from functools import wraps
+from typing import Any, Callable, List
+import threading
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from weather_api import ApiError, WeatherAPI
+
+
+def _in_script_thread() -> bool:
+    """Vérifier si le thread courant exécute un script Streamlit"""
+    return get_script_run_ctx(suppress_warning=True) is not None
+
+
+class StreamlitErrorReporter:
+    """Gestionnaire d'erreurs thread-safe, affiché depuis le thread du script"""
+
+    def __init__(self):
+        self._pending: List[ApiError] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, error: ApiError) -> None:
+        with self._lock:
+            self._pending.append(error)
+
+    def flush(self) -> None:
+        """Afficher les erreurs en attente (messages identiques regroupés)"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        shown = set()
+        for error in pending:
+            if error.message in shown:
+                continue
+            shown.add(error.message)
+            if error.level == 'warning':
+                st.warning(error.message)
+            else:
+                st.error(error.message)
+
+
+def _displays_errors(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Afficher les erreurs collectées à la fin d'un appel public"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            # Les threads du pool n'ont pas de contexte : seul le script affiche
+            if _in_script_thread():
+                self.reporter.flush()
+    return wrapper
+
+
+class StreamlitWeatherAPI(WeatherAPI):
+    """WeatherAPI dont les erreurs s'affichent dans la page Streamlit courante"""
+
+    def __init__(self, **kwargs: Any):
+        self.reporter = StreamlitErrorReporter()
+        super().__init__(error_handler=self.reporter, **kwargs)
+
+    get_coordinates = _displays_errors(WeatherAPI.get_coordinates)
+    get_weather_data = _displays_errors(WeatherAPI.get_weather_data)
+    get_air_quality = _displays_errors(WeatherAPI.get_air_quality)
+    get_weather_data_batch = _displays_errors(WeatherAPI.get_weather_data_batch)
+    get_air_quality_batch = _displays_errors(WeatherAPI.get_air_quality_batch)
+    get_multiple_cities_data = _displays_errors(WeatherAPI.get_multiple_cities_data)
@@ -0,0 +1,54 @@
+"""
+Configuration commune des tests (modules à la racine, cache mémoire, serveur bouchon)
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("METEO_CACHE_BACKEND", "memory")
+os.environ.setdefault("METEO_PREWARM", "0")
+
+
+class StubServer:
+    """Serveur HTTP local répondant `status` après `delay` secondes"""
+
+    def __init__(self):
+        self.status = 200
+        self.delay = 0.0
+        self.hits = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stub._lock:
+                    stub.hits += 1
+                time.sleep(stub.delay)
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    yield server
+    server.close()
@@ -0,0 +1,133 @@
+"""
+Tests du client asynchrone contre un serveur Open-Meteo bouchon (aiohttp)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from async_weather_api import AsyncWeatherAPI
+
+
+def forecast_payload(days: int):
+    """Prévision minimale valide sur `days` jours"""
+    dates = [f"2026-10-{16 + day:02d}" for day in range(days)]
+    hours = [f"{date}T{hour:02d}:00" for date in dates for hour in range(24)]
+    return {
+        'current': {'time': '2026-10-16T12:00', 'temperature_2m': 18.0, 'weather_code': 1},
+        'hourly': {'time': hours, 'temperature_2m': [15.0] * len(hours)},
+        'daily': {'time': dates, 'temperature_2m_max': [20.0] * days, 'temperature_2m_min': [10.0] * days}
+    }
+
+
+class OpenMeteoStub:
+    """Bouchon des trois endpoints ; `failures` réponses d'erreur avant succès"""
+
+    def __init__(self, failures=(), delay: float = 0.0):
+        self.failures = list(failures)
+        self.delay = delay
+        self.hits = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request):
+        self.hits += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.failures:
+            status, retry_after = self.failures.pop(0)
+            headers = {'Retry-After': str(retry_after)} if retry_after is not None else {}
+            return web.json_response({'error': True}, status=status, headers=headers)
+        if request.path == '/v1/search':
+            name = request.query['name']
+            return web.json_response({'results': [
+                {'latitude': 40.0 + len(name), 'longitude': 2.0, 'name': name, 'country': 'France'}
+            ]})
+        if request.path == '/v1/air-quality':
+            return web.json_response({'current': {'european_aqi': 20}})
+        return web.json_response(forecast_payload(int(request.query['forecast_days'])))
+
+
+async def run_against_stub(stub: OpenMeteoStub, scenario):
+    """Démarrer le bouchon, exécuter `scenario(api)` puis tout fermer"""
+    app = web.Application()
+    app.router.add_get('/{endpoint:.*}', stub.handle)
+    server = TestServer(app, host='127.0.0.1')
+    await server.start_server()
+    base = str(server.make_url('')).rstrip('/')
+    api = AsyncWeatherAPI(
+        retry_delay=0.01,
+        base_url=f"{base}/v1/forecast",
+        geocoding_url=f"{base}/v1/search",
+        air_quality_url=f"{base}/v1/air-quality"
+    )
+    try:
+        async with api:
+            return await scenario(api)
+    finally:
+        await server.close()
+
+
+def test_retries_server_errors_and_rate_limits():
+    stub = OpenMeteoStub(failures=[(503, None), (429, 0)])
+    result = asyncio.run(run_against_stub(stub, lambda api: api.get_weather_data(48.85, 2.35, 3)))
+    assert stub.hits == 3
+    assert result is not None and len(result['daily']['time']) == 3
+
+
+def test_keeps_the_network_error_when_retries_are_exhausted():
+    stub = OpenMeteoStub(failures=[(500, None)] * 3)
+
+    async def scenario(api):
+        return await api.get_weather_data(48.85, 2.35, 3), api.last_error
+
+    result, error = asyncio.run(run_against_stub(stub, scenario))
+    assert result is None
+    assert error.kind == 'http' and error.status == 500
+
+
+def test_cancellation_stops_pending_requests():
+    stub = OpenMeteoStub(delay=5.0)
+
+    async def scenario(api):
+        task = asyncio.create_task(api.get_multiple_cities_data(['Lyon', 'Nice']))
+        await asyncio.sleep(0.2)
+        started = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(run_against_stub(stub, scenario))
+    assert elapsed < 1.0
+    assert stub.hits == 2
+
+
+def test_fetches_multiple_cities_concurrently():
+    cities = ['Lyon', 'Nice', 'Rennes', 'Lille']
+    stub = OpenMeteoStub(delay=0.2)
+
+    async def scenario(api):
+        started = time.monotonic()
+        results = await api.get_multiple_cities_data(cities, days=2)
+        return results, time.monotonic() - started
+
+    results, elapsed = asyncio.run(run_against_stub(stub, scenario))
+    assert set(results) == set(cities)
+    for city in cities:
+        assert results[city]['coords']['name'] == city
+        assert len(results[city]['weather']['daily']['time']) == 2
+        assert results[city]['aqi']['current']['european_aqi'] == 20
+    # Géocodage puis prévision + qualité de l'air : 3 requêtes par ville, en parallèle
+    assert stub.hits == 3 * len(cities)
+    assert stub.max_in_flight >= len(cities)
+    assert elapsed < 3 * 0.2 * len(cities)
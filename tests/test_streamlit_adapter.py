@@ -0,0 +1,68 @@
+"""
+Tests de l'adaptateur Streamlit : erreurs signalées à chaque session
+"""
+
+import threading
+import time
+
+import streamlit_adapter
+from cache_backend import MemoryCache
+from single_flight import SingleFlight
+from streamlit_adapter import StreamlitWeatherAPI
+
+
+class FakeStreamlit:
+    """Remplace st.error / st.warning en mémorisant les messages affichés"""
+
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+
+    def error(self, message):
+        self.errors.append(message)
+
+    def warning(self, message):
+        self.warnings.append(message)
+
+
+def make_api(stub_server, single_flight):
+    api = StreamlitWeatherAPI(max_retries=1, cache=MemoryCache(), single_flight=single_flight)
+    api.base_url = f"{stub_server.url}/v1/forecast"
+    return api
+
+
+def test_coalesced_sessions_each_display_the_error(stub_server, monkeypatch):
+    stub_server.status = 404
+    stub_server.delay = 0.3
+    single_flight = SingleFlight()
+    sessions = [make_api(stub_server, single_flight) for _ in range(2)]
+
+    threads = [
+        threading.Thread(target=api.get_weather_data, args=(45.75, 4.85, 7))
+        for api in sessions
+    ]
+    threads[0].start()
+    time.sleep(0.1)
+    threads[1].start()
+    for thread in threads:
+        thread.join()
+
+    # Une seule requête amont, mais l'erreur parvient aux deux sessions
+    assert stub_server.hits == 1
+    for api in sessions:
+        assert api.last_error is not None and api.last_error.kind == 'http'
+        fake = FakeStreamlit()
+        monkeypatch.setattr(streamlit_adapter, "st", fake)
+        api.reporter.flush()
+        assert len(fake.errors) == 1 and "404" in fake.errors[0]
+
+
+def test_flush_groups_identical_messages(monkeypatch):
+    fake = FakeStreamlit()
+    monkeypatch.setattr(streamlit_adapter, "st", fake)
+    reporter = streamlit_adapter.StreamlitErrorReporter()
+    error = streamlit_adapter.ApiError('not_found', "Ville introuvable", level='warning')
+    reporter(error)
+    reporter(error)
+    reporter.flush()
+    assert fake.warnings == ["Ville introuvable"] and fake.errors == []
@@ -0,0 +1,86 @@
+"""
+Tests des versions vectorisées de WeatherAnalyzer : résultats identiques aux versions scalaires
+"""
+
+import numpy as np
+import pytest
+
+from config import WEATHER_CODES
+from weather_analyzer import WeatherAnalyzer
+
+RNG = np.random.default_rng(2026)
+SAMPLES = 20000
+
+
+def scalar_results(function, *columns, **kwargs):
+    """Appliquer une fonction scalaire élément par élément"""
+    return np.array([function(*(float(value) for value in row), **kwargs) for row in zip(*columns)])
+
+
+def random_values(low: float, high: float) -> np.ndarray:
+    """Valeurs aléatoires brutes et arrondies à 1 ou 2 décimales (cas réels de l'API)"""
+    raw = RNG.uniform(low, high, SAMPLES)
+    return np.concatenate([raw, raw.round(1), raw.round(2)])
+
+
+def half_steps(low: float, high: float) -> np.ndarray:
+    """Valeurs en x.x5, où l'arrondi à une décimale tombe pile entre deux pas"""
+    return np.arange(round(low * 10), round(high * 10)) / 10 + 0.05
+
+
+def grid(*axes):
+    """Produit cartésien de plusieurs axes, à plat"""
+    return [axis.ravel() for axis in np.meshgrid(*axes)]
+
+
+@pytest.mark.parametrize("units", ["metric", "imperial"])
+def test_comfort_index_batch_matches_scalar(units):
+    tie_temp, tie_humidity = grid(half_steps(-40, 110), np.arange(0, 101, 5.0))
+    temp = np.concatenate([random_values(-40, 110), tie_temp])
+    humidity = np.concatenate([random_values(0, 100), tie_humidity])
+    expected = scalar_results(WeatherAnalyzer.calculate_comfort_index, temp, humidity, units=units)
+    assert np.array_equal(WeatherAnalyzer.calculate_comfort_index_batch(temp, humidity, units), expected)
+
+
+@pytest.mark.parametrize("units, temp_limit, wind_limit", [("metric", 10, 4.8), ("imperial", 50, 3)])
+def test_wind_chill_batch_matches_scalar(units, temp_limit, wind_limit):
+    temps = np.array([temp_limit, np.nextafter(temp_limit, np.inf), np.nextafter(temp_limit, -np.inf), -30.05, 0.0])
+    winds = np.array([wind_limit, np.nextafter(wind_limit, np.inf), np.nextafter(wind_limit, -np.inf), 0.0, 60.05])
+    boundary_temp, boundary_wind = grid(np.concatenate([temps, half_steps(-40, 12)]), winds)
+    temp = np.concatenate([random_values(-40, 60), boundary_temp])
+    wind = np.concatenate([random_values(0, 80), boundary_wind])
+    expected = scalar_results(WeatherAnalyzer.calculate_wind_chill, temp, wind, units=units)
+    assert np.array_equal(WeatherAnalyzer.calculate_wind_chill_batch(temp, wind, units), expected)
+
+
+def test_global_comfort_index_batch_matches_scalar():
+    temp = np.concatenate([random_values(-30, 45), half_steps(-30, 45)])
+    size = len(temp)
+    humidity = np.resize(np.concatenate([random_values(0, 100), half_steps(0, 100)]), size)
+    wind = np.resize(np.concatenate([random_values(0, 120), half_steps(0, 120)]), size)
+    aqi = np.resize(np.concatenate([random_values(0, 300), half_steps(0, 300)]), size)
+    expected = scalar_results(WeatherAnalyzer.calculate_global_comfort_index, temp, humidity, wind, aqi)
+    assert np.array_equal(WeatherAnalyzer.calculate_global_comfort_index_batch(temp, humidity, wind, aqi), expected)
+
+
+def test_aqi_description_batch_matches_scalar():
+    bounds = np.array([20, 40, 60, 80, 100], dtype=np.float64)
+    values = np.concatenate([
+        random_values(-10, 200),
+        bounds, np.nextafter(bounds, np.inf), np.nextafter(bounds, -np.inf),
+        [0.0, -1.0, 500.0, np.nan]
+    ])
+    expected = scalar_results(WeatherAnalyzer.get_aqi_description, values)
+    assert list(WeatherAnalyzer.get_aqi_description_batch(values)) == list(expected)
+
+
+def test_weather_category_batch_matches_scalar():
+    codes = np.array(sorted(WEATHER_CODES) + [-5, -1, 4, 42, max(WEATHER_CODES) + 1, 1000])
+    for is_day in (0, 1):
+        expected = [WeatherAnalyzer.get_weather_category(int(code), is_day) for code in codes]
+        assert list(WeatherAnalyzer.get_weather_category_batch(codes, is_day)) == expected
+
+    # Jour et nuit mélangés, élément par élément
+    is_day = RNG.integers(0, 2, len(codes))
+    expected = [WeatherAnalyzer.get_weather_category(int(code), int(day)) for code, day in zip(codes, is_day)]
+    assert list(WeatherAnalyzer.get_weather_category_batch(codes, is_day)) == expected
@@ -3,24 +3,12 @@ Composants UI réutilisables pour l'application météo
 """
 
 import streamlit as st
-import base64
-import os
 from typing import Dict, Any
 from config import THEME_COLORS, WEATHER_GRADIENTS
 from weather_analyzer import WeatherAnalyzer
+from assets import get_base64_image, get_background_url, get_responsive_background_css
 
-def get_base64_image(image_path):
-    """Encoder une image en Base64 pour l'intégrer au CSS"""
-    if not image_path or not os.path.exists(image_path):
-        return None
-    try:
-        with open(image_path, "rb") as image_file:
-            encoded_string = base64.b64encode(image_file.read()).decode()
-            return f"data:image/png;base64,{encoded_string}"
-    except Exception:
-        return None
-
-# Mapping weather categories to local image paths for Base64 encoding
+# Mapping weather categories to local image paths (publiées via assets.py)
 WEATHER_IMAGES = {
     "sunny_day": "image/sunny_weather_1767458011348.png",
     "cloudy_day": "image/cloudy_weather_1767458030393.png",
@@ -50,7 +38,7 @@ def inject_custom_css(theme: str = 'premium', weather_category: str = 'sunny_day
     colors = THEME_COLORS[theme]
     gradient = WEATHER_GRADIENTS.get(weather_category, WEATHER_GRADIENTS['sunny_day'])
     
-    # Récupérer l'image en Base64
+    # Récupérer l'URL de l'image (statique et cacheable, calculée une seule fois)
     image_path = WEATHER_IMAGES.get(weather_category)
     
     # Fallback pour les images de nuit manquantes : réutilisation des images de jour
@@ -61,15 +49,21 @@ def inject_custom_css(theme: str = 'premium', weather_category: str = 'sunny_day
         if image_path:
             is_night_fallback = True
             
-    base64_image = get_base64_image(image_path) if image_path else None
+    # Si c'est un fallback nuit, on assombrit l'image
+    overlay = "linear-gradient(rgba(0,0,0,0.6), rgba(0,0,0,0.6))" if is_night_fallback else None
+    
+    # Variantes WebP/JPEG responsives (image-set + media queries) si disponibles
+    responsive_css = get_responsive_background_css(image_path, overlay) if image_path else None
+    image_url = None
+    if image_path and not responsive_css:
+        image_url = get_background_url(image_path)
     
     # Construction du style de fond
-    if base64_image:
-        # Si c'est un fallback nuit, on assombrit l'image
-        if is_night_fallback:
-            bg_style = f"linear-gradient(rgba(0,0,0,0.6), rgba(0,0,0,0.6)), url('{base64_image}') no-repeat center center fixed"
+    if image_url:
+        if overlay:
+            bg_style = f"{overlay}, url('{image_url}') no-repeat center center fixed"
         else:
-            bg_style = f"url('{base64_image}') no-repeat center center fixed"
+            bg_style = f"url('{image_url}') no-repeat center center fixed"
     else:
         bg_style = gradient
 
@@ -85,6 +79,7 @@ def inject_custom_css(theme: str = 'premium', weather_category: str = 'sunny_day
             background: {bg_style};
             background-size: cover;
         }}
+        {responsive_css or ''}
 
         /* Overlay principal subtil pour unifier le contraste */
         .main {{
@@ -186,6 +181,28 @@ def inject_custom_css(theme: str = 'premium', weather_category: str = 'sunny_day
             box-shadow: 0 4px 15px rgba(0,0,0,0.2);
         }}
 
+        /* Navigation entre sections (rendu à la demande) */
+        .st-key-active_tab {{
+            display: flex;
+            justify-content: center;
+            margin-bottom: 4rem;
+        }}
+
+        .st-key-active_tab button {{
+            background-color: rgba(255, 255, 255, 0.15) !important;
+            backdrop-filter: blur(40px);
+            -webkit-backdrop-filter: blur(40px);
+            border: 1px solid rgba(255, 255, 255, 0.3) !important;
+            color: rgba(255, 255, 255, 0.85) !important;
+            font-weight: 500 !important;
+        }}
+
+        .st-key-active_tab button[kind$="Active"] {{
+            background-color: rgba(255, 255, 255, 0.4) !important;
+            color: white !important;
+            font-weight: 600 !important;
+        }}
+
         .recommendation-card {{
             background: rgba(255, 255, 255, 0.2);
             backdrop-filter: blur(30px);
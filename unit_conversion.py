@@ -0,0 +1,98 @@
+"""
+Conversion vectorisée des données météo (métrique → impérial)
+
+Les données sont récupérées et mises en cache en métrique uniquement ;
+la vue impériale est calculée localement à la demande.
+"""
+
+from typing import Any, Callable, Dict
+import numpy as np
+
+# Champs convertis par section de la réponse Open-Meteo
+TEMPERATURE_FIELDS = {
+    'current': ['temperature_2m', 'apparent_temperature'],
+    'hourly': ['temperature_2m'],
+    'daily': ['temperature_2m_max', 'temperature_2m_min']
+}
+WIND_FIELDS = {
+    'current': ['wind_speed_10m'],
+    'hourly': ['wind_speed_10m'],
+    'daily': ['wind_speed_10m_max']
+}
+
+KMH_PER_MPH = 1.609344
+
+
+def celsius_to_fahrenheit(values: np.ndarray) -> np.ndarray:
+    """Convertir des températures °C en °F"""
+    return values * 9 / 5 + 32
+
+
+def kmh_to_mph(values: np.ndarray) -> np.ndarray:
+    """Convertir des vitesses km/h en mph"""
+    return values / KMH_PER_MPH
+
+
+def _convert_values(values: Any, convert: Callable[[np.ndarray], np.ndarray]) -> Any:
+    """
+    Convertir une valeur ou une série en une seule passe NumPy
+
+    Args:
+        values: Scalaire ou liste (les valeurs None sont conservées)
+        convert: Fonction de conversion vectorisée
+
+    Returns:
+        Valeur(s) convertie(s) arrondie(s) au dixième, même forme qu'en entrée
+    """
+    if values is None:
+        return None
+
+    arr = np.asarray(values, dtype=np.float64)
+    converted = np.round(convert(arr), 1)
+
+    if converted.ndim == 0:
+        return None if np.isnan(converted) else float(converted)
+
+    result = converted.tolist()
+    missing = np.isnan(converted)
+    if missing.any():
+        for idx in np.flatnonzero(missing):
+            result[idx] = None
+    return result
+
+
+def convert_weather_data(data: Dict[str, Any], units: str = "metric") -> Dict[str, Any]:
+    """
+    Produire la vue des données météo dans le système d'unités demandé
+
+    Args:
+        data: Données météo en métrique (°C, km/h)
+        units: Système d'unités ("metric" ou "imperial")
+
+    Returns:
+        Données météo converties (l'original n'est pas modifié)
+    """
+    if units == "metric" or not data:
+        return data
+
+    converted = dict(data)
+    for section in ('current', 'hourly', 'daily'):
+        if section not in data:
+            continue
+        block = dict(data[section])
+        section_units = dict(data.get(f'{section}_units', {}))
+
+        for field in TEMPERATURE_FIELDS[section]:
+            if field in block:
+                block[field] = _convert_values(block[field], celsius_to_fahrenheit)
+                section_units[field] = '°F'
+        for field in WIND_FIELDS[section]:
+            if field in block:
+                block[field] = _convert_values(block[field], kmh_to_mph)
+                section_units[field] = 'mp/h'
+
+        converted[section] = block
+        if section_units:
+            converted[f'{section}_units'] = section_units
+
+    return converted
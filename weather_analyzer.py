@@ -7,6 +7,59 @@ import numpy as np
 from typing import Dict, List, Any, Tuple
 from config import WEATHER_CODES
 
+# Bornes supérieures (incluses) des tranches AQI et libellés associés
+AQI_BOUNDS = np.array([20, 40, 60, 80, 100], dtype=np.float64)
+AQI_LABELS = np.array([
+    "Excellent 🟢", "Bon 🟢", "Moyen 🟡", "Médiocre 🟠", "Mauvais 🔴", "Très Mauvais 🟣"
+], dtype=object)
+
+
+def _build_category_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Construire les tables code météo → catégorie (jour, nuit)
+
+    Returns:
+        Tuple (table jour, table nuit) indexées par code ; les codes inconnus
+        valent "cloudy" comme dans get_weather_category
+    """
+    size = max(WEATHER_CODES) + 1
+    day = np.full(size, "cloudy_day", dtype=object)
+    night = np.full(size, "cloudy_night", dtype=object)
+    for code, info in WEATHER_CODES.items():
+        category = info["category"]
+        day[code] = f"{category}_day"
+        night[code] = "clear_night" if category == "sunny" else f"{category}_night"
+    return day, night
+
+
+CATEGORY_DAY, CATEGORY_NIGHT = _build_category_tables()
+
+
+def _round_like_python(values: np.ndarray, ndigits: int = 1) -> np.ndarray:
+    """
+    Arrondir un tableau exactement comme round() de Python
+
+    np.round multiplie par 10**ndigits avant d'arrondir, ce qui peut faire
+    basculer les valeurs situées à un demi-pas près ; ces rares éléments
+    sont recalculés avec round() pour garantir des résultats identiques.
+
+    Args:
+        values: Tableau de flottants
+        ndigits: Nombre de décimales
+
+    Returns:
+        Tableau arrondi (float64)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, ndigits)
+    scaled = np.abs(values * 10 ** ndigits)
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded = np.array(rounded, copy=True)
+        for idx in zip(*np.nonzero(near_tie)):
+            rounded[idx] = round(float(values[idx]), ndigits)
+    return rounded
+
 
 class WeatherAnalyzer:
     """Classe pour analyser les données météo"""
@@ -121,6 +174,102 @@ class WeatherAnalyzer:
         else:
             return "Très Mauvais 🟣"
     
+    @staticmethod
+    def calculate_comfort_index_batch(temp: Any, humidity: Any, units: str = "metric") -> np.ndarray:
+        """
+        Version vectorisée de calculate_comfort_index
+        
+        Args:
+            temp: Températures (tableau NumPy, colonne DataFrame, liste...)
+            humidity: Humidités relatives (%), même forme ou diffusable
+            units: Système d'unités
+            
+        Returns:
+            Tableau des indices de confort (identiques à la version scalaire)
+        """
+        temp = np.asarray(temp, dtype=np.float64)
+        humidity = np.asarray(humidity, dtype=np.float64)
+        
+        if units == "imperial":
+            hi = 0.5 * (temp + 61.0 + ((temp - 68.0) * 1.2) + (humidity * 0.094))
+        else:
+            hi = temp + 0.5 * (0.1 * temp) + (humidity - 50) * 0.1
+        
+        return _round_like_python(hi, 1)
+    
+    @staticmethod
+    def calculate_wind_chill_batch(temp: Any, wind_speed: Any, units: str = "metric") -> np.ndarray:
+        """
+        Version vectorisée de calculate_wind_chill
+        
+        Args:
+            temp: Températures
+            wind_speed: Vitesses du vent, même forme ou diffusable
+            units: Système d'unités
+            
+        Returns:
+            Tableau des températures ressenties (identiques à la version scalaire)
+        """
+        temp = np.asarray(temp, dtype=np.float64)
+        wind_speed = np.asarray(wind_speed, dtype=np.float64)
+        
+        if units == "metric":
+            applies = (temp <= 10) & (wind_speed >= 4.8)
+            a, b, c = 13.12, 11.37, 0.3965
+        else:
+            applies = (temp <= 50) & (wind_speed >= 3)
+            a, b, c = 35.74, 35.75, 0.4275
+        
+        # Puissance calculée uniquement là où la formule s'applique
+        wind_factor = np.power(wind_speed, 0.16, where=applies, out=np.zeros(applies.shape))
+        wc = a + 0.6215 * temp - b * wind_factor + c * temp * wind_factor
+        
+        return np.where(applies, _round_like_python(wc, 1), temp)
+    
+    @staticmethod
+    def calculate_global_comfort_index_batch(temp: Any, humidity: Any, wind_speed: Any, aqi: Any = 0) -> np.ndarray:
+        """
+        Version vectorisée de calculate_global_comfort_index
+        
+        Les entrées sont diffusées entre elles : par exemple des tableaux
+        (villes, heures) pour l'ensemble des villes et des échéances.
+        
+        Args:
+            temp: Températures (°C)
+            humidity: Humidités (%)
+            wind_speed: Vents (km/h)
+            aqi: Qualité de l'air
+            
+        Returns:
+            Tableau des scores sur 100 (identiques à la version scalaire)
+        """
+        temp = np.asarray(temp, dtype=np.float64)
+        humidity = np.asarray(humidity, dtype=np.float64)
+        wind_speed = np.asarray(wind_speed, dtype=np.float64)
+        aqi = np.asarray(aqi, dtype=np.float64)
+        
+        # Pénalités appliquées dans le même ordre que la version scalaire
+        score = 100.0 - np.where(temp < 18, (18 - temp) * 2, np.where(temp > 25, (temp - 25) * 2.5, 0.0))
+        score = score - np.where(humidity < 40, (40 - humidity) * 0.5, np.where(humidity > 60, (humidity - 60) * 0.5, 0.0))
+        score = score - np.where(wind_speed > 20, (wind_speed - 20) * 0.5, 0.0)
+        score = score - np.where(aqi > 50, (aqi - 50) * 0.5, 0.0)
+        
+        return np.clip(_round_like_python(score, 1), 0.0, 100.0)
+    
+    @staticmethod
+    def get_aqi_description_batch(aqi_values: Any) -> np.ndarray:
+        """
+        Version vectorisée de get_aqi_description
+        
+        Args:
+            aqi_values: Valeurs de l'AQI
+            
+        Returns:
+            Tableau (dtype object) des descriptions textuelles
+        """
+        aqi_values = np.asarray(aqi_values, dtype=np.float64)
+        return AQI_LABELS[np.searchsorted(AQI_BOUNDS, aqi_values, side='left')]
+    
     @staticmethod
     def get_weather_description(code: int) -> str:
         """
@@ -156,6 +305,26 @@ class WeatherAnalyzer:
                 return "clear_night"
             return f"{category}_night"
     
+    @staticmethod
+    def get_weather_category_batch(codes: Any, is_day: Any = 1) -> np.ndarray:
+        """
+        Version vectorisée de get_weather_category (tables de correspondance)
+        
+        Args:
+            codes: Codes météo Open-Meteo
+            is_day: 1 pour le jour, 0 pour la nuit (scalaire ou tableau)
+            
+        Returns:
+            Tableau (dtype object) des catégories détaillées
+        """
+        codes = np.asarray(codes, dtype=np.int64)
+        known = (codes >= 0) & (codes < len(CATEGORY_DAY))
+        index = np.where(known, codes, 0)
+        
+        day = np.where(known, CATEGORY_DAY[index], "cloudy_day")
+        night = np.where(known, CATEGORY_NIGHT[index], "cloudy_night")
+        return np.where(np.asarray(is_day) == 1, day, night).astype(object)
+    
     @staticmethod
     def get_recommendations(temp: float, code: int, units: str = "metric") -> List[str]:
         """
@@ -208,7 +377,7 @@ class WeatherAnalyzer:
         Analyser les données quotidiennes
         
         Args:
-            daily_data: Données quotidiennes de l'API
+            daily_data: Données quotidiennes (ForecastBlock ou JSON de l'API)
             
         Returns:
             Tuple (DataFrame, statistiques)
@@ -1,99 +1,355 @@
 """
 Module pour gérer les appels API météo avec gestion d'erreurs robuste
+
+Couche d'accès aux données pure (sans Streamlit) : les erreurs sont
+renvoyées sous forme structurée (ApiError) via `last_error` et un
+gestionnaire optionnel ; leur affichage relève de streamlit_adapter.py.
+Utilisable dans un worker, une CLI ou un benchmark.
 """
 
-import streamlit as st
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlparse
+from typing import Optional, Dict, Any, Callable, List, Tuple
+from bisect import bisect_left
+import threading
 import time
 from config import (
     API_BASE_URL, GEOCODING_URL, AIR_QUALITY_URL,
-    CACHE_TTL_WEATHER, CACHE_TTL_GEOCODING, CACHE_TTL_AIR_QUALITY
+    CACHE_TTL_WEATHER, CACHE_TTL_GEOCODING, CACHE_TTL_AIR_QUALITY,
+    CACHE_STALE_WHILE_REVALIDATE, CACHE_HARD_TTL_WEATHER,
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_DEFAULT_TIMEOUT, HTTP_TIMEOUTS,
+    FETCH_MAX_WORKERS, BATCH_MAX_LOCATIONS, PREDEFINED_CITY_COORDS,
+    RATE_LIMIT_MAX_WAIT, RETRYABLE_STATUS
 )
+from fetch_engine import run_parallel, submit_background
+from cache_backend import get_default_cache
+from single_flight import SingleFlight
+from rate_limiter import RateLimitExceeded, get_rate_limiter, parse_retry_after
+from resilience import RetryBudget, backoff_delay, get_circuit_breaker, get_retry_budget
+from geocoding_index import get_geocoding_index
+from unit_conversion import convert_weather_data
+
+
+# Table statique des villes prédéfinies, indexée par nom normalisé
+_STATIC_COORDS = {name.strip().lower(): coords for name, coords in PREDEFINED_CITY_COORDS.items()}
+
+# Requêtes identiques simultanées regroupées pour tout le processus
+_SINGLE_FLIGHT = SingleFlight()
+
+# Sessions HTTP partagées par taille de pool (une par processus)
+_SHARED_SESSIONS: Dict[int, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_shared_session(pool_size: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+    """
+    Obtenir la session HTTP partagée (pool keep-alive par hôte)
+    
+    Args:
+        pool_size: Nombre maximal de connexions conservées par hôte
+        
+    Returns:
+        Session requests réutilisable entre threads
+    """
+    session = _SHARED_SESSIONS.get(pool_size)
+    if session is not None:
+        return session
+    
+    with _SESSIONS_LOCK:
+        session = _SHARED_SESSIONS.get(pool_size)
+        if session is None:
+            session = requests.Session()
+            # Un pool urllib3 par hôte, connexions gardées ouvertes (keep-alive)
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=pool_size
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            # Aucun cookie : la session est partagée entre tous les utilisateurs
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            session.headers.update({'Accept': 'application/json'})
+            _SHARED_SESSIONS[pool_size] = session
+    return session
+
+
+def get_single_flight_stats() -> Dict[str, int]:
+    """
+    Compteurs du regroupement des requêtes identiques
+    
+    Returns:
+        Dictionnaire {executed, coalesced, in_flight}
+    """
+    return _SINGLE_FLIGHT.stats()
+
+
+def get_data_age(data: Optional[Dict[str, Any]], now: Optional[float] = None) -> Optional[float]:
+    """
+    Calculer l'âge d'une prévision à partir de son horodatage de récupération
+    
+    Args:
+        data: Données météo (champ `_fetched_at` ajouté à la mise en cache)
+        now: Horodatage de référence (défaut : maintenant)
+        
+    Returns:
+        Âge en secondes, ou None si inconnu
+    """
+    fetched_at = data.get('_fetched_at') if data else None
+    if fetched_at is None:
+        return None
+    return max(0.0, (now if now is not None else time.time()) - fetched_at)
+
+
+class ApiError:
+    """Erreur structurée d'un appel API (sans dépendance à l'interface)"""
+    
+    __slots__ = ('kind', 'message', 'level', 'status', 'retry_in')
+    
+    def __init__(
+        self,
+        kind: str,
+        message: str,
+        level: str = 'error',
+        status: Optional[int] = None,
+        retry_in: Optional[float] = None
+    ):
+        """
+        Args:
+            kind: Catégorie (circuit_open, rate_limited, timeout, connection,
+                http, unexpected, not_found, invalid_data)
+            message: Message destiné à l'utilisateur
+            level: Gravité ('error' ou 'warning')
+            status: Code HTTP éventuel
+            retry_in: Délai conseillé avant de réessayer (secondes)
+        """
+        self.kind = kind
+        self.message = message
+        self.level = level
+        self.status = status
+        self.retry_in = retry_in
+    
+    def __repr__(self) -> str:
+        return f"ApiError({self.kind!r}, {self.message!r})"
+
+
+# Gestionnaire d'erreurs : reçoit chaque ApiError signalée
+ErrorHandler = Callable[[ApiError], None]
 
 
 class WeatherAPI:
     """Classe pour gérer les appels API météo avec retry et cache"""
     
-    def __init__(self, max_retries: int = 3, retry_delay: float = 1.0):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        pool_size: int = HTTP_POOL_MAXSIZE,
+        timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        cache=None,
+        single_flight: Optional[SingleFlight] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        error_handler: Optional[ErrorHandler] = None
+    ):
         self.base_url = API_BASE_URL
         self.geocoding_url = GEOCODING_URL
         self.air_quality_url = AIR_QUALITY_URL
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.session = get_shared_session(pool_size)
+        self.timeouts = timeouts if timeouts is not None else HTTP_TIMEOUTS
+        self.cache = cache if cache is not None else get_default_cache()
+        self.single_flight = single_flight if single_flight is not None else _SINGLE_FLIGHT
+        self.retry_budget = retry_budget if retry_budget is not None else get_retry_budget()
+        self.error_handler = error_handler
+        self.last_error: Optional[ApiError] = None
     
-    def _make_request(self, url: str, params: Dict[str, Any]) -> Optional[Dict]:
+    def _report(self, error: ApiError, report_errors: bool = True) -> None:
         """
-        Effectue une requête HTTP avec retry automatique
+        Signaler une erreur (last_error, puis gestionnaire si demandé)
+        
+        Args:
+            error: Erreur structurée
+            report_errors: Transmettre au gestionnaire (False en arrière-plan)
+        """
+        self.last_error = error
+        if report_errors and self.error_handler is not None:
+            self.error_handler(error)
+    
+    def _get_timeout(self, url: str) -> Tuple[float, float]:
+        """
+        Obtenir les délais (connexion, lecture) configurés pour l'hôte
+        
+        Args:
+            url: URL de l'API
+            
+        Returns:
+            Tuple (timeout connexion, timeout lecture) en secondes
+        """
+        host = urlparse(url).hostname or ''
+        return self.timeouts.get(host, HTTP_DEFAULT_TIMEOUT)
+    
+    def _make_request(self, url: str, params: Dict[str, Any], report_errors: bool = True) -> Optional[Dict]:
+        """
+        Effectue une requête HTTP, partagée avec les appels identiques en cours
+        
+        Les appelants simultanés d'un même (endpoint, paramètres) reçoivent
+        le résultat d'une seule requête amont (single-flight), erreur
+        comprise : chacun la signale à son gestionnaire et dans `last_error`.
         
         Args:
             url: URL de l'API
             params: Paramètres de la requête
+            report_errors: Signaler les erreurs au gestionnaire (False en arrière-plan)
             
         Returns:
             Données JSON ou None en cas d'erreur
         """
+        key = (url, tuple(sorted((name, str(value)) for name, value in params.items())))
+        data, error = self.single_flight.do(key, lambda: self._send_request(url, params))
+        # Chaque appelant (meneur ou regroupé) signale l'erreur partagée à son propre gestionnaire
+        if error is not None:
+            self._report(error, report_errors)
+        return data
+    
+    def _can_retry(self, attempt: int) -> bool:
+        """Nouvelle tentative autorisée (essais restants et budget de retry global)"""
+        return attempt < self.max_retries - 1 and self.retry_budget.try_spend()
+    
+    def _wait_before_retry(self, attempt: int, retry_after: Optional[float] = None) -> bool:
+        """
+        Attendre avant une nouvelle tentative, si elle est autorisée
+        
+        Args:
+            attempt: Numéro de la tentative échouée (0 pour la première)
+            retry_after: Délai imposé par le serveur (Retry-After)
+            
+        Returns:
+            True si une nouvelle tentative doit suivre
+        """
+        if not self._can_retry(attempt):
+            return False
+        time.sleep(min(backoff_delay(attempt, self.retry_delay, retry_after=retry_after), RATE_LIMIT_MAX_WAIT))
+        return True
+    
+    def _send_request(self, url: str, params: Dict[str, Any]) -> Tuple[Optional[Dict], Optional[ApiError]]:
+        """
+        Effectue une requête HTTP avec retry automatique
+        
+        Le débit et le nombre de requêtes simultanées sont bornés par
+        endpoint (rate_limiter). Les échecs sont retentés après `Retry-After`
+        ou un délai exponentiel avec aléa, dans la limite du budget de retry
+        global ; un endpoint en panne est court-circuité (resilience).
+        
+        Args:
+            url: URL de l'API
+            params: Paramètres de la requête
+            
+        Returns:
+            Tuple (données JSON ou None, erreur structurée ou None) ; l'erreur
+            n'est pas signalée ici mais par chaque appelant (voir _make_request)
+        """
+        limiter = get_rate_limiter(url)
+        breaker = get_circuit_breaker(url)
+        self.retry_budget.record_request()
         for attempt in range(self.max_retries):
+            if not breaker.allow():
+                # Endpoint en panne : échec immédiat, le cache sert les données existantes
+                retry_in = breaker.retry_in()
+                return None, ApiError(
+                    'circuit_open',
+                    f"🔌 Service Open-Meteo momentanément indisponible. Nouvel essai dans {retry_in:.0f} s.",
+                    retry_in=retry_in
+                )
             try:
-                response = requests.get(url, params=params, timeout=10)
+                with limiter.acquire():
+                    response = self.session.get(url, params=params, timeout=self._get_timeout(url))
+                if response.status_code == 429:
+                    # Pause partagée : tous les appelants de l'endpoint attendent
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    limiter.pause(backoff_delay(attempt, self.retry_delay, retry_after=retry_after))
+                    if self._can_retry(attempt):
+                        continue
+                elif response.status_code in RETRYABLE_STATUS:
+                    breaker.record_failure()
+                    if self._wait_before_retry(attempt, parse_retry_after(response.headers.get('Retry-After'))):
+                        continue
+                else:
+                    breaker.record_success()
                 response.raise_for_status()
-                return response.json()
+                return response.json(), None
+            except RateLimitExceeded as e:
+                return None, ApiError(
+                    'rate_limited',
+                    f"🚦 Trop de requêtes vers Open-Meteo. Réessayez dans {e.wait:.0f} s.",
+                    retry_in=e.wait
+                )
             except requests.exceptions.Timeout:
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                breaker.record_failure()
+                if self._wait_before_retry(attempt):
                     continue
-                st.error("⏱️ Délai d'attente dépassé. Veuillez réessayer.")
-                return None
+                return None, ApiError('timeout', "⏱️ Délai d'attente dépassé. Veuillez réessayer.")
             except requests.exceptions.ConnectionError:
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                breaker.record_failure()
+                if self._wait_before_retry(attempt):
                     continue
-                st.error("🌐 Erreur de connexion. Vérifiez votre connexion Internet.")
-                return None
+                return None, ApiError(
+                    'connection', "🌐 Erreur de connexion. Vérifiez votre connexion Internet."
+                )
             except requests.exceptions.HTTPError as e:
-                st.error(f"❌ Erreur HTTP: {e}")
-                return None
+                status = e.response.status_code if e.response is not None else None
+                if status == 429:
+                    error = ApiError(
+                        'rate_limited', "🚦 Trop de requêtes vers Open-Meteo. Veuillez réessayer plus tard.", status=status
+                    )
+                else:
+                    error = ApiError('http', f"❌ Erreur HTTP: {e}", status=status)
+                return None, error
             except Exception as e:
-                st.error(f"❌ Erreur inattendue: {e}")
-                return None
-        return None
+                return None, ApiError('unexpected', f"❌ Erreur inattendue: {e}")
+        return None, None
     
-    @st.cache_data(ttl=CACHE_TTL_GEOCODING, show_spinner=False)
-    def get_coordinates(_self, city_name: str) -> Optional[Dict[str, Any]]:
+    def get_coordinates(self, city_name: str) -> Optional[Dict[str, Any]]:
         """
-        Obtenir les coordonnées d'une ville (avec cache)
+        Obtenir les coordonnées d'une ville (table statique, index local, puis cache)
         
         Args:
-            city_name: Nom de la ville
+            city_name: Nom de la ville, éventuellement suivi du pays ("Lyon, France")
             
         Returns:
             Dictionnaire avec lat, lon, name, country, timezone
         """
-        params = {
-            'name': city_name,
-            'count': 1,
-            'language': 'fr',
-            'format': 'json'
-        }
+        static = _STATIC_COORDS.get(city_name.strip().lower())
+        if static is not None:
+            return dict(static)
         
-        data = _self._make_request(_self.geocoding_url, params)
+        # Index hors ligne, correspondance exacte uniquement (accents et casse tolérés) :
+        # un nom proche désignerait une autre ville (Bergen -> Berne) ; les lieux
+        # absents passent par le cache puis l'API distante
+        local = get_geocoding_index().lookup(city_name, fuzzy=False)
+        if local is not None:
+            return local
         
-        if data and 'results' in data and len(data['results']) > 0:
-            result = data['results'][0]
-            return {
-                'lat': result['latitude'],
-                'lon': result['longitude'],
-                'name': result['name'],
-                'country': result.get('country', 'N/A'),
-                'timezone': result.get('timezone', 'auto')
-            }
+        cache_key = self._geocoding_cache_key(city_name)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        params = self._geocoding_params(city_name)
+        data = self._make_request(self.geocoding_url, params)
+        
+        coords = self._parse_coordinates(data)
+        if coords:
+            self.cache.set(cache_key, coords, CACHE_TTL_GEOCODING)
+            return coords
         
-        st.warning(f"🔍 Ville '{city_name}' non trouvée.")
+        if data is not None:
+            self._report(ApiError('not_found', f"🔍 Ville '{city_name}' non trouvée.", level='warning'))
         return None
     
-    @st.cache_data(ttl=CACHE_TTL_WEATHER, show_spinner=False)
     def get_weather_data(
-        _self,
+        self,
         lat: float,
         lon: float,
         days: int = 7,
@@ -111,31 +367,26 @@ class WeatherAPI:
         Returns:
             Données météo complètes
         """
-        temp_unit = "celsius" if units == "metric" else "fahrenheit"
-        wind_unit = "kmh" if units == "metric" else "mph"
+        # Le cache ne contient que des données métriques, converties à la demande,
+        # sur l'horizon le plus long déjà récupéré pour la position
+        cache_key = self._weather_cache_key(lat, lon)
+        cached = self._get_cached_forecast(cache_key, days)
+        if cached is not None:
+            return convert_weather_data(cached, units)
         
-        params = {
-            'latitude': lat,
-            'longitude': lon,
-            'current': 'temperature_2m,relative_humidity_2m,apparent_temperature,precipitation,weather_code,wind_speed_10m,pressure_msl,cloud_cover,is_day',
-            'hourly': 'temperature_2m,precipitation_probability,precipitation,weather_code,wind_speed_10m,relative_humidity_2m,cloud_cover',
-            'daily': 'weather_code,temperature_2m_max,temperature_2m_min,precipitation_sum,precipitation_probability_max,wind_speed_10m_max,sunrise,sunset,uv_index_max',
-            'timezone': 'auto',
-            'forecast_days': min(days, 16),  # Max 16 jours
-            'temperature_unit': temp_unit,
-            'wind_speed_unit': wind_unit
-        }
+        params = self._weather_params(lat, lon, days)
+        data = self._make_request(self.base_url, params)
         
-        data = _self._make_request(_self.base_url, params)
+        if data and self._validate_weather_data(data):
+            self._store_forecast(cache_key, data)
+            return convert_weather_data(self._slice_forecast(data, days), units)
         
-        if data and _self._validate_weather_data(data):
-            return data
-        
-        st.error("❌ Données météo invalides ou incomplètes.")
+        if data is not None:
+            # Sans réponse, l'erreur réseau a déjà été signalée
+            self._report(ApiError('invalid_data', "❌ Données météo invalides ou incomplètes."))
         return None
     
-    @st.cache_data(ttl=CACHE_TTL_AIR_QUALITY, show_spinner=False)
-    def get_air_quality(_self, lat: float, lon: float) -> Optional[Dict[str, Any]]:
+    def get_air_quality(self, lat: float, lon: float) -> Optional[Dict[str, Any]]:
         """
         Récupérer l'indice de qualité de l'air
         
@@ -146,15 +397,374 @@ class WeatherAPI:
         Returns:
             Données de qualité de l'air
         """
-        params = {
+        cache_key = self._air_quality_cache_key(lat, lon)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        params = self._air_quality_params(lat, lon)
+        data = self._make_request(self.air_quality_url, params)
+        if data:
+            self.cache.set(cache_key, data, CACHE_TTL_AIR_QUALITY)
+            return data
+        return {'current': {}}
+    
+    def get_weather_data_batch(
+        self,
+        locations: List[Tuple[float, float]],
+        days: int = 7,
+        units: str = "metric"
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Récupérer les données météo de plusieurs positions en lots
+        
+        Les positions absentes du cache sont regroupées en requêtes
+        multi-coordonnées (au plus BATCH_MAX_LOCATIONS par requête),
+        puis chaque réponse alimente l'entrée de cache de sa position.
+        
+        Args:
+            locations: Liste de tuples (latitude, longitude)
+            days: Nombre de jours de prévisions (1-16)
+            units: Système d'unités ("metric" ou "imperial")
+            
+        Returns:
+            Liste des données météo, dans l'ordre des positions
+        """
+        results = self._fetch_batch(
+            locations,
+            self.base_url,
+            lambda chunk: self._batch_params(self._weather_params(0.0, 0.0, days), chunk),
+            self._weather_cache_key,
+            lambda key: self._get_cached_forecast(key, days),
+            self._store_forecast,
+            self._validate_weather_data
+        )
+        return [
+            convert_weather_data(self._slice_forecast(data, days) if data else data, units)
+            for data in results
+        ]
+    
+    def get_air_quality_batch(
+        self,
+        locations: List[Tuple[float, float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Récupérer la qualité de l'air de plusieurs positions en lots
+        
+        Args:
+            locations: Liste de tuples (latitude, longitude)
+            
+        Returns:
+            Liste des données de qualité de l'air, dans l'ordre des positions
+        """
+        results = self._fetch_batch(
+            locations,
+            self.air_quality_url,
+            lambda chunk: self._batch_params(self._air_quality_params(0.0, 0.0), chunk),
+            self._air_quality_cache_key,
+            self.cache.get,
+            lambda key, data: self.cache.set(key, data, CACHE_TTL_AIR_QUALITY),
+            lambda data: 'current' in data
+        )
+        return [data if data else {'current': {}} for data in results]
+    
+    def warm_locations(
+        self,
+        locations: List[Tuple[float, float]],
+        days: int,
+        air_quality: bool = False
+    ) -> List[Tuple[float, float]]:
+        """
+        Rafraîchir le cache de plusieurs positions sans le consulter
+        
+        Utilisé par le pré-chauffage : les données sont récupérées en
+        requêtes multi-coordonnées même si le cache est encore valide.
+        
+        Args:
+            locations: Liste de tuples (latitude, longitude)
+            days: Nombre de jours de prévisions (prévisions uniquement)
+            air_quality: True pour la qualité de l'air, False pour les prévisions
+            
+        Returns:
+            Positions effectivement rafraîchies (les autres sont en échec)
+        """
+        if air_quality:
+            results = self._fetch_batch(
+                locations,
+                self.air_quality_url,
+                lambda chunk: self._batch_params(self._air_quality_params(0.0, 0.0), chunk),
+                self._air_quality_cache_key,
+                lambda key: None,
+                lambda key, data: self.cache.set(key, data, CACHE_TTL_AIR_QUALITY),
+                lambda data: 'current' in data,
+                report_errors=False
+            )
+        else:
+            results = self._fetch_batch(
+                locations,
+                self.base_url,
+                lambda chunk: self._batch_params(self._weather_params(0.0, 0.0, days), chunk),
+                self._weather_cache_key,
+                lambda key: None,
+                self._store_forecast,
+                self._validate_weather_data,
+                report_errors=False
+            )
+        return [location for location, data in zip(locations, results) if data is not None]
+    
+    def _fetch_batch(
+        self,
+        locations: List[Tuple[float, float]],
+        url: str,
+        build_params,
+        cache_key: Callable[[float, float], str],
+        cache_lookup: Callable[[str], Optional[Dict[str, Any]]],
+        store: Callable[[str, Dict[str, Any]], None],
+        validate,
+        report_errors: bool = True
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Servir un lot de positions depuis le cache puis l'API multi-coordonnées
+        
+        Args:
+            locations: Liste de tuples (latitude, longitude)
+            url: URL de l'API
+            build_params: Fonction (lot) -> paramètres de requête
+            cache_key: Fonction (lat, lon) -> clé de cache
+            cache_lookup: Fonction (clé) -> payload en cache utilisable ou None
+            store: Fonction (clé, payload) enregistrant un payload valide en cache
+            validate: Fonction de validation d'un payload individuel
+            report_errors: Signaler les erreurs au gestionnaire (False en arrière-plan)
+            
+        Returns:
+            Liste des payloads (None si indisponible), dans l'ordre des positions
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(locations)
+        
+        # Positions à récupérer, dédoublonnées : clé -> (position, indices)
+        missing: Dict[str, Tuple[Tuple[float, float], List[int]]] = {}
+        for idx, (lat, lon) in enumerate(locations):
+            key = cache_key(lat, lon)
+            cached = cache_lookup(key)
+            if cached is not None:
+                results[idx] = cached
+            elif key in missing:
+                missing[key][1].append(idx)
+            else:
+                missing[key] = ((lat, lon), [idx])
+        
+        if not missing:
+            return results
+        
+        keys = list(missing)
+        chunks = [
+            keys[start:start + BATCH_MAX_LOCATIONS]
+            for start in range(0, len(keys), BATCH_MAX_LOCATIONS)
+        ]
+        responses = run_parallel({
+            chunk_idx: (
+                self._make_request,
+                (url, build_params([missing[key][0] for key in chunk]), report_errors)
+            )
+            for chunk_idx, chunk in enumerate(chunks)
+        })
+        
+        for chunk_idx, chunk in enumerate(chunks):
+            data = responses.get(chunk_idx)
+            if data is None:
+                continue
+            # Une seule position : l'API renvoie un objet au lieu d'une liste
+            payloads = data if isinstance(data, list) else [data]
+            for key, payload in zip(chunk, payloads):
+                if not payload or not validate(payload):
+                    continue
+                store(key, payload)
+                for idx in missing[key][1]:
+                    results[idx] = payload
+        
+        return results
+    
+    @staticmethod
+    def _geocoding_params(city_name: str) -> Dict[str, Any]:
+        """Paramètres de recherche de l'API de géocodage"""
+        return {
+            'name': city_name,
+            'count': 1,
+            'language': 'fr',
+            'format': 'json'
+        }
+    
+    @staticmethod
+    def _weather_params(lat: float, lon: float, days: int) -> Dict[str, Any]:
+        """
+        Paramètres de l'API de prévisions (toujours en métrique)
+        
+        Un jour de plus que demandé est récupéré : la fenêtre des 24 heures
+        suivantes reste complète en fin de journée (voir _slice_forecast).
+        """
+        return {
+            'latitude': lat,
+            'longitude': lon,
+            'current': 'temperature_2m,relative_humidity_2m,apparent_temperature,precipitation,weather_code,wind_speed_10m,pressure_msl,cloud_cover,is_day',
+            'hourly': 'temperature_2m,precipitation_probability,precipitation,weather_code,wind_speed_10m,relative_humidity_2m,cloud_cover',
+            'daily': 'weather_code,temperature_2m_max,temperature_2m_min,precipitation_sum,precipitation_probability_max,wind_speed_10m_max,sunrise,sunset,uv_index_max',
+            'timezone': 'auto',
+            'forecast_days': min(days + 1, 16),  # Max 16 jours
+            'temperature_unit': 'celsius',
+            'wind_speed_unit': 'kmh'
+        }
+    
+    @staticmethod
+    def _air_quality_params(lat: float, lon: float) -> Dict[str, Any]:
+        """Paramètres de l'API de qualité de l'air"""
+        return {
             'latitude': lat,
             'longitude': lon,
             'current': 'european_aqi,us_aqi,uv_index,dust,carbon_monoxide,pm10,pm2_5',
             'timezone': 'auto'
         }
+    
+    @staticmethod
+    def _batch_params(params: Dict[str, Any], chunk: List[Tuple[float, float]]) -> Dict[str, Any]:
+        """Remplacer la position unique par la liste des positions d'un lot"""
+        params['latitude'] = ','.join(str(lat) for lat, _ in chunk)
+        params['longitude'] = ','.join(str(lon) for _, lon in chunk)
+        return params
+    
+    @staticmethod
+    def _parse_coordinates(data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Extraire les coordonnées de la réponse de géocodage
         
-        data = _self._make_request(_self.air_quality_url, params)
-        return data if data else {'current': {}}
+        Args:
+            data: Réponse JSON de l'API de géocodage
+            
+        Returns:
+            Dictionnaire avec lat, lon, name, country, timezone ou None
+        """
+        if data and 'results' in data and len(data['results']) > 0:
+            result = data['results'][0]
+            return {
+                'lat': result['latitude'],
+                'lon': result['longitude'],
+                'name': result['name'],
+                'country': result.get('country', 'N/A'),
+                'timezone': result.get('timezone', 'auto')
+            }
+        return None
+    
+    @staticmethod
+    def _geocoding_cache_key(city_name: str) -> str:
+        """Clé de cache du géocodage d'une ville"""
+        return f"geocoding:{city_name.strip().lower()}"
+    
+    @staticmethod
+    def _weather_cache_key(lat: float, lon: float) -> str:
+        """Clé de cache des prévisions (métriques, tous horizons) d'une position"""
+        return f"weather:{lat:.4f}:{lon:.4f}"
+    
+    def _store_forecast(self, cache_key: str, data: Dict[str, Any]) -> None:
+        """
+        Horodater puis mettre en cache une prévision métrique
+        
+        Args:
+            cache_key: Clé de cache de la position
+            data: Prévision validée (reçoit le champ `_fetched_at`)
+        """
+        data['_fetched_at'] = time.time()
+        # En stale-while-revalidate, l'entrée survit jusqu'à l'expiration ferme
+        ttl = CACHE_HARD_TTL_WEATHER if CACHE_STALE_WHILE_REVALIDATE else CACHE_TTL_WEATHER
+        self.cache.set(cache_key, data, max(ttl, CACHE_TTL_WEATHER))
+    
+    def _get_cached_forecast(self, cache_key: str, days: int) -> Optional[Dict[str, Any]]:
+        """
+        Servir une prévision depuis le cache si son horizon est suffisant
+        
+        Une prévision plus ancienne que CACHE_TTL_WEATHER est servie telle
+        quelle (stale-while-revalidate) et rafraîchie en arrière-plan.
+        
+        Args:
+            cache_key: Clé de cache de la position
+            days: Nombre de jours demandés
+            
+        Returns:
+            Prévision tronquée à `days` jours, ou None si absente/trop courte/périmée
+        """
+        cached = self.cache.get(cache_key)
+        if cached is None or len(cached['daily']['time']) < min(days + 1, 16):
+            return None
+        
+        age = get_data_age(cached)
+        if age is not None and age >= CACHE_TTL_WEATHER:
+            if not CACHE_STALE_WHILE_REVALIDATE:
+                return None
+            _, lat, lon = cache_key.split(':')
+            submit_background(
+                cache_key,
+                self._refresh_forecast,
+                cache_key, float(lat), float(lon), len(cached['daily']['time']) - 1
+            )
+        return self._slice_forecast(cached, days)
+    
+    def _refresh_forecast(self, cache_key: str, lat: float, lon: float, days: int) -> None:
+        """
+        Rafraîchir une prévision en cache (exécuté en arrière-plan)
+        
+        En cas d'échec, la prévision périmée reste servie jusqu'à son
+        expiration ferme (CACHE_HARD_TTL_WEATHER).
+        
+        Args:
+            cache_key: Clé de cache de la position
+            lat: Latitude
+            lon: Longitude
+            days: Horizon à conserver (celui de l'entrée en cache, jour supplémentaire exclu)
+        """
+        data = self._make_request(self.base_url, self._weather_params(lat, lon, days), report_errors=False)
+        if data and self._validate_weather_data(data):
+            self._store_forecast(cache_key, data)
+    
+    @staticmethod
+    def _slice_forecast(data: Dict[str, Any], days: int) -> Dict[str, Any]:
+        """
+        Tronquer une prévision aux `days` premiers jours
+        
+        Les séries horaires conservent un jour de plus, pour que la fenêtre
+        des 24 heures suivantes (ForecastFrame.hourly_window) soit complète
+        quelle que soit l'heure courante.
+        
+        Args:
+            data: Prévision complète
+            days: Nombre de jours à conserver
+            
+        Returns:
+            Prévision avec les séries quotidiennes et horaires tronquées
+        """
+        daily_times = data['daily']['time']
+        if days >= len(daily_times):
+            return data
+        
+        # Première heure du jour suivant le lendemain ('YYYY-MM-DD' < 'YYYY-MM-DDTHH:MM')
+        hourly_times = data['hourly']['time']
+        if days + 1 < len(daily_times):
+            hour_count = bisect_left(hourly_times, daily_times[days + 1])
+        else:
+            hour_count = len(hourly_times)
+        
+        sliced = dict(data)
+        sliced['daily'] = {
+            key: values[:days] if isinstance(values, list) else values
+            for key, values in data['daily'].items()
+        }
+        sliced['hourly'] = {
+            key: values[:hour_count] if isinstance(values, list) else values
+            for key, values in data['hourly'].items()
+        }
+        return sliced
+    
+    @staticmethod
+    def _air_quality_cache_key(lat: float, lon: float) -> str:
+        """Clé de cache de la qualité de l'air d'une position"""
+        return f"air_quality:{lat:.4f}:{lon:.4f}"
     
     @staticmethod
     def _validate_weather_data(data: Dict[str, Any]) -> bool:
@@ -182,36 +792,50 @@ class WeatherAPI:
         self,
         city_names: list,
         days: int = 7,
-        units: str = "metric"
+        units: str = "metric",
+        max_workers: int = FETCH_MAX_WORKERS
     ) -> Dict[str, Optional[Dict]]:
         """
-        Récupérer les données pour plusieurs villes
+        Récupérer les données pour plusieurs villes en parallèle
+        
+        Les coordonnées de toutes les villes sont résolues simultanément,
+        puis toutes les requêtes météo et qualité de l'air partent ensemble.
         
         Args:
             city_names: Liste des noms de villes
             days: Nombre de jours de prévisions
             units: Système d'unités
+            max_workers: Nombre maximal de requêtes simultanées
             
         Returns:
             Dictionnaire {ville: données_météo}
         """
-        results = {}
+        # Étape 1 : géocodage de toutes les villes
+        coords_by_city = run_parallel(
+            {city: (self.get_coordinates, (city,)) for city in city_names},
+            max_workers
+        )
         
-        for city in city_names:
-            coords = self.get_coordinates(city)
-            if coords:
-                weather = self.get_weather_data(
-                    coords['lat'],
-                    coords['lon'],
-                    days,
-                    units
-                )
-                results[city] = {
-                    'coords': coords,
-                    'weather': weather,
-                    'aqi': self.get_air_quality(coords['lat'], coords['lon'])
-                }
-            else:
-                results[city] = None
+        # Étape 2 : prévisions et qualité de l'air de toutes les villes trouvées,
+        # en requêtes multi-coordonnées lancées simultanément
+        found = [city for city in city_names if coords_by_city.get(city)]
+        locations = [
+            (coords_by_city[city]['lat'], coords_by_city[city]['lon'])
+            for city in found
+        ]
+        fetched = run_parallel({
+            'weather': (self.get_weather_data_batch, (locations, days, units)),
+            'aqi': (self.get_air_quality_batch, (locations,))
+        }, max_workers)
+        weather_list = fetched.get('weather') or [None] * len(found)
+        aqi_list = fetched.get('aqi') or [None] * len(found)
+        
+        results: Dict[str, Optional[Dict]] = {city: None for city in city_names}
+        for city, weather, aqi in zip(found, weather_list, aqi_list):
+            results[city] = {
+                'coords': coords_by_city[city],
+                'weather': weather,
+                'aqi': aqi or {'current': {}}
+            }
         
         return results